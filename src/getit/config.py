@@ -40,7 +40,7 @@ def load_config() -> dict:
     config_path = get_config_file_path()
     if config_path.exists():
         try:
-            with open(config_path, encoding="utf-8") as f:
+            with config_path.open(encoding="utf-8") as f:
                 data = json.load(f)
                 # Convert path strings back to Path objects
                 if "download_dir" in data and isinstance(data["download_dir"], str):
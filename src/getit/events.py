@@ -7,18 +7,25 @@ to CLI/TUI/MCP clients. Supports both sync and async callbacks.
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import inspect
 import logging
-from collections import defaultdict
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Iterable
+from functools import partial
+from types import MethodType
 from typing import Any
+from weakref import WeakMethod
 
 logger = logging.getLogger(__name__)
 
-DOWNLOAD_PROGRESS = "download_progress"
-DOWNLOAD_COMPLETE = "download_complete"
-DOWNLOAD_ERROR = "download_error"
+# Interned so subscriber lookups keyed by these names hit the identity fast path
+DOWNLOAD_PROGRESS = sys.intern("download_progress")
+DOWNLOAD_COMPLETE = sys.intern("download_complete")
+DOWNLOAD_ERROR = sys.intern("download_error")
+
+# A subscription as stored by EventBus: the callback itself, or a WeakMethod
+# when the callback is a bound method
+_Subscriber = Callable[[Any], Any] | WeakMethod[MethodType]
 
 
 class EventBus:
@@ -29,11 +36,100 @@ class EventBus:
     - Emit events with optional data
     - Sync and async callbacks
     - Exception handling (logs and continues)
+
+    Bound methods are held weakly, so subscribing one does not keep its
+    object alive; the subscription is dropped once the object is collected.
+    As in weakref.WeakSet, the weakref callback only queues the removal, and
+    the queue is flushed by the next subscribe, unsubscribe or emit, so a
+    garbage collection never changes the subscriber dicts mid-iteration.
+
+    Async callbacks are queued and started together on the next loop
+    iteration, so a burst of emits is scheduled in one batch; each callback
+    still runs concurrently with the others.
     """
 
+    __slots__ = (
+        "_subscribers",
+        "_dispatch",
+        "_pending_removals",
+        "_pending",
+        "_drain_loop",
+        "_in_flight",
+    )
+
     def __init__(self) -> None:
         """Initialize the event bus."""
-        self._subscribers: dict[str, list[Callable[[Any], Any]]] = defaultdict(list)
+        # Per event, an insertion-ordered set of callbacks (dict keys), so
+        # subscribe's duplicate check and unsubscribe are single hash probes.
+        self._subscribers: dict[str, dict[_Subscriber, None]] = {}
+        # Per event, immutable (sync, async) snapshots of _subscribers, rebuilt
+        # when subscriptions change. emit iterates these without copying or
+        # inspecting callbacks, even if a callback (un)subscribes meanwhile.
+        self._dispatch: dict[str, tuple[tuple[_Subscriber, ...], tuple[_Subscriber, ...]]] = {}
+        # (event, key) of bound-method subscriptions whose object was collected
+        self._pending_removals: list[tuple[str, _Subscriber]] = []
+        # Async deliveries (event, callback, data) waiting for _drain, and the
+        # loop it is scheduled on (None when no drain is scheduled).
+        self._pending: list[tuple[str, _Subscriber, Any]] = []
+        self._drain_loop: asyncio.AbstractEventLoop | None = None
+        # gather() futures of started batches, kept referenced until done
+        self._in_flight: set[asyncio.Future[list[Any]]] = set()
+
+    @staticmethod
+    def _subscriber_key(
+        callback: Callable[[Any], Any],
+        on_collected: Callable[[WeakMethod[MethodType]], None] | None = None,
+    ) -> _Subscriber:
+        """Return how a callback is stored in _subscribers.
+
+        Bound methods are wrapped in a WeakMethod. Callbacks that cannot be
+        weakly referenced, or whose object is unhashable, are kept as-is.
+        """
+        if not inspect.ismethod(callback):
+            return callback
+        try:
+            key = WeakMethod(callback, on_collected)
+            hash(key)
+        except TypeError:
+            return callback
+        return key
+
+    def _refresh_dispatch(self, event: str) -> None:
+        """Rebuild the dispatch snapshots for an event after a change."""
+        callbacks = self._subscribers.get(event)
+        if not callbacks:
+            self._dispatch.pop(event, None)
+            return
+        sync_callbacks: list[_Subscriber] = []
+        async_callbacks: list[_Subscriber] = []
+        for key in callbacks:
+            callback = key() if isinstance(key, WeakMethod) else key
+            if inspect.iscoroutinefunction(callback):
+                async_callbacks.append(key)
+            else:
+                sync_callbacks.append(key)
+        self._dispatch[event] = (tuple(sync_callbacks), tuple(async_callbacks))
+
+    def _remove(self, event: str, key: _Subscriber) -> None:
+        """Drop a stored subscription, if present."""
+        callbacks = self._subscribers.get(event)
+        if callbacks and key in callbacks:
+            del callbacks[key]
+            self._refresh_dispatch(event)
+
+    def _on_collected(self, event: str, key: _Subscriber) -> None:
+        """Queue the removal of a subscription whose object was collected.
+
+        Runs inside whatever garbage collection freed the object, so it must
+        not touch _subscribers; _flush_removals does that later.
+        """
+        self._pending_removals.append((event, key))
+
+    def _flush_removals(self) -> None:
+        """Drop the subscriptions queued by _on_collected."""
+        pending = self._pending_removals
+        while pending:
+            self._remove(*pending.pop())
 
     def subscribe(self, event: str, callback: Callable[[Any], Any]) -> None:
         """Subscribe a callback to an event.
@@ -42,8 +138,27 @@ class EventBus:
             event: Event name (e.g., DOWNLOAD_PROGRESS)
             callback: Callable that receives event data
         """
-        if callback not in self._subscribers[event]:
-            self._subscribers[event].append(callback)
+        if self._pending_removals:
+            self._flush_removals()
+        key = self._subscriber_key(callback, partial(self._on_collected, event))
+        callbacks = self._subscribers.get(event)
+        if callbacks is None:
+            self._subscribers[event] = {key: None}
+        elif key in callbacks:
+            return
+        else:
+            callbacks[key] = None
+        self._refresh_dispatch(event)
+
+    def subscribe_many(self, events: Iterable[str], callback: Callable[[Any], Any]) -> None:
+        """Subscribe a callback to several events at once.
+
+        Args:
+            events: Event names (e.g., (DOWNLOAD_PROGRESS, DOWNLOAD_COMPLETE))
+            callback: Callable that receives event data
+        """
+        for event in events:
+            self.subscribe(event, callback)
 
     def unsubscribe(self, event: str, callback: Callable[[Any], Any]) -> None:
         """Unsubscribe a callback from an event.
@@ -52,46 +167,118 @@ class EventBus:
             event: Event name
             callback: Callback to remove
         """
-        if event in self._subscribers:
-            with contextlib.suppress(ValueError):
-                self._subscribers[event].remove(callback)
+        if self._pending_removals:
+            self._flush_removals()
+        self._remove(event, self._subscriber_key(callback))
+
+    def subscriber_count(self, event: str) -> int:
+        """Return the number of callbacks subscribed to an event.
+
+        Args:
+            event: Event name
+
+        Returns:
+            Number of subscribed callbacks (0 if none)
+        """
+        if self._pending_removals:
+            self._flush_removals()
+        return len(self._subscribers.get(event, ()))
 
     def emit(self, event: str, data: Any = None) -> None:
         """Emit an event to all subscribers.
 
-        Handles both sync and async callbacks. Async callbacks are scheduled
-        as background tasks and exceptions are logged.
+        Handles both sync and async callbacks. Sync callbacks are called in
+        subscription order; async callbacks are then queued and started
+        concurrently on the next loop iteration. Exceptions are logged.
 
         Args:
             event: Event name
             data: Optional data to pass to callbacks
         """
-        callbacks = list(self._subscribers.get(event, []))
-        for callback in callbacks:
+        if self._pending_removals:
+            self._flush_removals()
+        dispatch = self._dispatch.get(event)
+        if dispatch is None:
+            return
+
+        sync_callbacks, async_callbacks = dispatch
+        for key in sync_callbacks:
+            callback = key() if isinstance(key, WeakMethod) else key
+            if callback is None:
+                continue
             try:
-                if inspect.iscoroutinefunction(callback):
-                    try:
-                        loop = asyncio.get_running_loop()
-                    except RuntimeError:
-                        logger.warning(
-                            "No running event loop; skipping async callback",
-                            extra={"event": event},
-                        )
-                        continue
-                    task = loop.create_task(callback(data))
-                    task.add_done_callback(self._log_task_exception)
-                else:
-                    callback(data)
+                callback(data)
             except Exception:
                 logger.exception(
-                    f"Exception in callback for event {event}",
+                    "Exception in callback for event %s",
+                    event,
                     extra={"event": event},
                 )
 
-    @staticmethod
-    def _log_task_exception(task: asyncio.Task) -> None:
-        """Log exceptions raised by async callbacks."""
-        with contextlib.suppress(asyncio.CancelledError):
-            exception = task.exception()
-            if exception:
-                logger.exception("Exception in async callback", exc_info=exception)
+        if not async_callbacks:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning(
+                "No running event loop; skipping async callbacks",
+                extra={"event": event},
+            )
+            return
+        # Emits within one loop iteration share a single scheduled drain
+        if self._drain_loop is not loop:
+            if self._drain_loop is not None:
+                # The drain scheduled on another loop never ran because that
+                # loop stopped first; its deliveries go with it.
+                logger.warning(
+                    "Dropping %d async callbacks queued on a stopped event loop",
+                    len(self._pending),
+                    extra={"event": event},
+                )
+                self._pending.clear()
+            self._drain_loop = loop
+            loop.call_soon(self._drain, loop)
+        self._pending.extend((event, key, data) for key in async_callbacks)
+
+    def _drain(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start every queued async callback as one gathered batch."""
+        if self._drain_loop is not loop:
+            # Superseded by a drain on another loop, which owns the queue now
+            return
+        self._drain_loop = None
+        queued, self._pending = self._pending, []
+        events: list[str] = []
+        coroutines: list[Any] = []
+        for event, key, data in queued:
+            callback = key() if isinstance(key, WeakMethod) else key
+            if callback is None:
+                continue
+            try:
+                coroutines.append(callback(data))
+            except Exception:
+                logger.exception(
+                    "Exception in callback for event %s",
+                    event,
+                    extra={"event": event},
+                )
+                continue
+            events.append(event)
+        if not coroutines:
+            return
+        batch = asyncio.gather(*coroutines, return_exceptions=True)
+        self._in_flight.add(batch)
+        batch.add_done_callback(partial(self._finish_batch, events))
+
+    def _finish_batch(self, events: list[str], batch: asyncio.Future[list[Any]]) -> None:
+        """Log the exceptions raised by a batch of async callbacks."""
+        self._in_flight.discard(batch)
+        if batch.cancelled():
+            return
+        for event, result in zip(events, batch.result(), strict=True):
+            if isinstance(result, Exception):
+                logger.exception(
+                    "Exception in callback for event %s",
+                    event,
+                    exc_info=result,
+                    extra={"event": event},
+                )
@@ -4,7 +4,8 @@ import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, ClassVar
-from urllib.parse import urlparse
+
+from getit.utils.url import ALLOWED_SCHEMES, parse_url
 
 if TYPE_CHECKING:
     from getit.utils.http import HTTPClient
@@ -32,8 +33,6 @@ class InvalidURLError(ExtractorError):
         super().__init__(message)
 
 
-ALLOWED_SCHEMES = frozenset({"http", "https"})
-
 SIZE_MULTIPLIERS: dict[str, int] = {
     "B": 1,
     "KB": 1024,
@@ -69,7 +68,7 @@ def parse_size_string(text: str) -> int:
 
 
 def validate_url_scheme(url: str) -> None:
-    parsed = urlparse(url)
+    parsed = parse_url(url)
     if parsed.scheme.lower() not in ALLOWED_SCHEMES:
         raise InvalidURLError(f"Invalid URL scheme: {parsed.scheme!r}. Only http/https allowed.")
     if not parsed.netloc:
@@ -106,33 +105,46 @@ class FolderInfo:
 class BaseExtractor(ABC):
     SUPPORTED_DOMAINS: ClassVar[tuple[str, ...]] = ()
     EXTRACTOR_NAME: ClassVar[str] = "base"
-    URL_PATTERN: ClassVar[re.Pattern[str] | None] = None
+    # A str pattern is compiled on first use, so merely importing an
+    # extractor does not pay for it
+    URL_PATTERN: ClassVar[re.Pattern[str] | str | None] = None
 
     def __init__(self, http_client: HTTPClient):
         self.http = http_client
 
     @classmethod
     def can_handle(cls, url: str) -> bool:
-        parsed = urlparse(url)
+        parsed = parse_url(url)
         if parsed.scheme.lower() not in ALLOWED_SCHEMES:
             return False
         if not parsed.netloc:
             return False
         domain = parsed.netloc.lower().replace("www.", "")
         if any(d in domain for d in cls.SUPPORTED_DOMAINS):
-            if cls.URL_PATTERN:
-                return bool(cls.URL_PATTERN.match(url))
+            pattern = cls._url_pattern()
+            if pattern:
+                return bool(pattern.match(url))
             return True
         return False
 
+    @classmethod
+    def _url_pattern(cls) -> re.Pattern[str] | None:
+        """Return URL_PATTERN, compiling and caching it if given as a str."""
+        pattern = cls.URL_PATTERN
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+            cls.URL_PATTERN = pattern
+        return pattern
+
     @classmethod
     def extract_id(cls, url: str) -> str | None:
-        if cls.URL_PATTERN:
-            match = cls.URL_PATTERN.match(url)
+        pattern = cls._url_pattern()
+        if pattern:
+            match = pattern.match(url)
             if match:
                 groups = match.groupdict()
                 return groups.get("id") or groups.get("content_id")
-        parsed = urlparse(url)
+        parsed = parse_url(url)
         parts = parsed.path.strip("/").split("/")
         return parts[-1] if parts else None
 
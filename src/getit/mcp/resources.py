@@ -8,60 +8,93 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
+from collections.abc import Callable
+from operator import attrgetter
 from typing import Any
+from weakref import WeakSet
 
 from mcp.server.session import ServerSession
 from pydantic.networks import AnyUrl
 
 from getit.events import DOWNLOAD_COMPLETE, DOWNLOAD_ERROR, DOWNLOAD_PROGRESS
-from getit.mcp.server import get_context, mcp
+from getit.mcp.server import ServerContext, get_context, mcp
 from getit.mcp.tools import _ensure_services_ready
+from getit.tasks import TaskInfo
 
 logger = logging.getLogger(__name__)
 
-ACTIVE_DOWNLOADS_URI = "active-downloads://list"
+# Interned so incoming URIs can be matched by identity once interned themselves
+ACTIVE_DOWNLOADS_URI = sys.intern("active-downloads://list")
 
-# Track subscribed sessions
-_subscribed_sessions: set[ServerSession] = set()
+_ACTIVE_DOWNLOADS_URL = AnyUrl(ACTIVE_DOWNLOADS_URI)
+_DOWNLOAD_EVENTS = (DOWNLOAD_PROGRESS, DOWNLOAD_COMPLETE, DOWNLOAD_ERROR)
+
+# Track subscribed sessions; weak references so sessions that disconnect
+# without unsubscribing can still be garbage collected
+_subscribed_sessions: WeakSet[ServerSession] = WeakSet()
 _event_handlers_registered = False
-_registration_lock = asyncio.Lock()
+
+# (key, getter) pairs used to serialize TaskInfo objects for the resource
+_TASK_FIELDS: tuple[tuple[str, Callable[[TaskInfo], Any]], ...] = (
+    ("task_id", attrgetter("task_id")),
+    ("url", attrgetter("url")),
+    ("status", attrgetter("status.value")),
+    ("progress", attrgetter("progress")),
+    ("output_dir", lambda task: str(task.output_dir)),
+    ("created_at", lambda task: task.created_at.isoformat()),
+    ("updated_at", lambda task: task.updated_at.isoformat()),
+    ("error", attrgetter("error")),
+)
 
 
-async def _register_event_handlers() -> None:
-    """Register EventBus handlers for download events (lazy initialization)."""
+async def _register_event_handlers(ctx: ServerContext | None = None) -> None:
+    """Register EventBus handlers for download events (lazy initialization).
+
+    The flag is checked and set without awaiting in between, so concurrent
+    first subscriptions on the event loop cannot register handlers twice.
+    """
     global _event_handlers_registered
 
-    async with _registration_lock:
-        if _event_handlers_registered:
-            return
+    if _event_handlers_registered:
+        return
 
+    if ctx is None:
         ctx = get_context()
+    _event_handlers_registered = True
 
-        # Register handlers for all download events
-        ctx.event_bus.subscribe(DOWNLOAD_PROGRESS, _on_download_event)
-        ctx.event_bus.subscribe(DOWNLOAD_COMPLETE, _on_download_event)
-        ctx.event_bus.subscribe(DOWNLOAD_ERROR, _on_download_event)
+    # Register handlers for all download events
+    ctx.event_bus.subscribe_many(_DOWNLOAD_EVENTS, _on_download_event)
 
-        _event_handlers_registered = True
-        logger.info("EventBus handlers registered for active_downloads resource")
+    logger.info("EventBus handlers registered for active_downloads resource")
 
 
 async def _on_download_event(data: Any) -> None:
-    """Notify all subscribed sessions when a download event occurs."""
+    """Notify all subscribed sessions when a download event occurs.
+
+    Returns before doing any work when nobody is subscribed, which is the
+    common case for the high-frequency DOWNLOAD_PROGRESS event.
+    """
     if not _subscribed_sessions:
         return
 
-    # Notify all subscribed sessions
-    resource_uri = AnyUrl(ACTIVE_DOWNLOADS_URI)
-    for session in list(_subscribed_sessions):
-        try:
-            await session.send_resource_updated(resource_uri)
-        except Exception:
-            logger.exception(
+    # Notify all subscribed sessions concurrently
+    sessions = list(_subscribed_sessions)
+    results = await asyncio.gather(
+        *(session.send_resource_updated(_ACTIVE_DOWNLOADS_URL) for session in sessions),
+        return_exceptions=True,
+    )
+    dropped = []
+    for session, result in zip(sessions, results, strict=True):
+        if isinstance(result, Exception):
+            logger.error(
                 "Failed to notify session of resource update",
+                exc_info=result,
                 extra={"uri": ACTIVE_DOWNLOADS_URI},
             )
-            _subscribed_sessions.discard(session)
+            dropped.append(session)
+    if dropped:
+        _subscribed_sessions.difference_update(dropped)
 
 
 @mcp.resource(ACTIVE_DOWNLOADS_URI)
@@ -71,61 +104,67 @@ async def active_downloads() -> list[dict[str, Any]]:
     Returns a list of all active download tasks with their current status,
     progress, and metadata.
     """
-    await _ensure_services_ready()
+    return await list_active_downloads(get_context())
+
+
+async def list_active_downloads(ctx: ServerContext) -> list[dict[str, Any]]:
+    """Serialize the active download tasks of the given server context.
+
+    Args:
+        ctx: Server context whose task registry is queried
+    """
+    # Same checks as _ensure_services_ready, inlined: this runs on every
+    # resource read, and once the services are up it creates no coroutine.
+    if ctx.task_registry._db is None:
+        await ctx.task_registry.connect()
+    if ctx.download_service and ctx.download_service._manager is None:
+        await ctx.download_service.start()
 
-    ctx = get_context()
     active_tasks = await ctx.task_registry.list_active()
 
     # Convert TaskInfo objects to dicts for JSON serialization
-    tasks_data = []
-    for task in active_tasks:
-        tasks_data.append(
-            {
-                "task_id": task.task_id,
-                "url": task.url,
-                "status": task.status.value,
-                "progress": task.progress,
-                "output_dir": str(task.output_dir),
-                "created_at": task.created_at.isoformat(),
-                "updated_at": task.updated_at.isoformat(),
-                "error": task.error,
-            }
-        )
-
-    return tasks_data
+    return [{key: getter(task) for key, getter in _TASK_FIELDS} for task in active_tasks]
+
+
+def _intern_uri(uri: AnyUrl | str) -> str:
+    """Normalize an incoming resource URI to an interned string."""
+    return sys.intern(str(uri))
 
 
 # Register subscription handlers using FastMCP's internal MCP server
 @mcp._mcp_server.subscribe_resource()
-async def handle_subscribe(uri: str) -> None:
+async def handle_subscribe(uri: AnyUrl | str, ctx: ServerContext | None = None) -> None:
     """Handle resource subscription requests.
 
     Args:
-        uri: The resource URI being subscribed to
+        uri: The resource URI being subscribed to (the MCP server passes an AnyUrl)
+        ctx: Server context to use; defaults to the current context
     """
-    if uri != ACTIVE_DOWNLOADS_URI:
+    if _intern_uri(uri) is not ACTIVE_DOWNLOADS_URI:
         return
 
-    await _ensure_services_ready()
-    await _register_event_handlers()
+    if ctx is None:
+        ctx = get_context()
+    await _ensure_services_ready(ctx)
+    await _register_event_handlers(ctx)
 
     session = mcp._mcp_server.request_context.session
     _subscribed_sessions.add(session)
 
     logger.info(
         "Client subscribed to resource",
-        extra={"uri": uri, "session_count": len(_subscribed_sessions)},
+        extra={"uri": ACTIVE_DOWNLOADS_URI, "session_count": len(_subscribed_sessions)},
     )
 
 
 @mcp._mcp_server.unsubscribe_resource()
-async def handle_unsubscribe(uri: str) -> None:
+async def handle_unsubscribe(uri: AnyUrl | str) -> None:
     """Handle resource unsubscription requests.
 
     Args:
-        uri: The resource URI being unsubscribed from
+        uri: The resource URI being unsubscribed from (the MCP server passes an AnyUrl)
     """
-    if uri != ACTIVE_DOWNLOADS_URI:
+    if _intern_uri(uri) is not ACTIVE_DOWNLOADS_URI:
         return
 
     session = mcp._mcp_server.request_context.session
@@ -133,5 +172,5 @@ async def handle_unsubscribe(uri: str) -> None:
 
     logger.info(
         "Client unsubscribed from resource",
-        extra={"uri": uri, "session_count": len(_subscribed_sessions)},
+        extra={"uri": ACTIVE_DOWNLOADS_URI, "session_count": len(_subscribed_sessions)},
     )
@@ -5,7 +5,7 @@ Provides MCP tools, resources, and prompts for download management via stdio tra
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from contextvars import ContextVar
 
 from mcp.server.fastmcp import FastMCP
 
@@ -21,26 +21,66 @@ from getit.service import DownloadService
 from getit.tasks import TaskRegistry
 
 
-@dataclass
 class ServerContext:
-    """Holds shared state for MCP server components."""
+    """Holds shared state for MCP server components.
 
-    event_bus: EventBus = field(default_factory=EventBus)
-    task_registry: TaskRegistry = field(default_factory=TaskRegistry)
-    extractor_registry: type[ExtractorRegistry] = field(default=ExtractorRegistry)
-    download_service: DownloadService | None = None
+    The event bus and task registry are created on first access, so code paths
+    that never touch them (e.g. listing prompts) skip their construction.
+    """
+
+    __slots__ = ("_event_bus", "_task_registry", "extractor_registry", "download_service")
+
+    def __init__(
+        self,
+        event_bus: EventBus | None = None,
+        task_registry: TaskRegistry | None = None,
+        extractor_registry: type[ExtractorRegistry] = ExtractorRegistry,
+        download_service: DownloadService | None = None,
+    ) -> None:
+        self._event_bus = event_bus
+        self._task_registry = task_registry
+        self.extractor_registry = extractor_registry
+        self.download_service = download_service
+
+    @property
+    def event_bus(self) -> EventBus:
+        if self._event_bus is None:
+            self._event_bus = EventBus()
+        return self._event_bus
+
+    @event_bus.setter
+    def event_bus(self, value: EventBus) -> None:
+        self._event_bus = value
+
+    @property
+    def task_registry(self) -> TaskRegistry:
+        if self._task_registry is None:
+            self._task_registry = TaskRegistry()
+        return self._task_registry
+
+    @task_registry.setter
+    def task_registry(self, value: TaskRegistry) -> None:
+        self._task_registry = value
 
 
 mcp = FastMCP("getit")
 
-_context: ServerContext | None = None
+# The current ServerContext, held in a context variable so it can be swapped
+# and later restored with the token from set() without leaking into other
+# code. Tasks copy the context when they are created: call create_server()
+# before starting the tasks that serve requests, since a value set inside
+# one task is not seen by its siblings. This does not make separate servers
+# independent; mcp and the resource subscription state are still shared
+# module globals.
+_context: ContextVar[ServerContext | None] = ContextVar("getit_mcp_context", default=None)
 
 
 def get_context() -> ServerContext:
     """Get the current server context. Raises if not initialized."""
-    if _context is None:
+    ctx = _context.get()
+    if ctx is None:
         raise RuntimeError("Server context not initialized. Call create_server() first.")
-    return _context
+    return ctx
 
 
 def create_server() -> tuple[FastMCP, ServerContext]:
@@ -49,17 +89,16 @@ def create_server() -> tuple[FastMCP, ServerContext]:
     Returns:
         Tuple of (FastMCP instance, ServerContext with registries)
     """
-    global _context
-
-    _context = ServerContext()
-    _context.download_service = DownloadService(
-        registry=_context.extractor_registry,
-        event_bus=_context.event_bus,
-        task_registry=_context.task_registry,
+    ctx = ServerContext()
+    ctx.download_service = DownloadService(
+        registry=ctx.extractor_registry,
+        event_bus=ctx.event_bus,
+        task_registry=ctx.task_registry,
         settings=get_settings(),
     )
+    _context.set(ctx)
 
-    return mcp, _context
+    return mcp, ctx
 
 
 def main() -> None:
@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from getit.mcp.server import get_context, mcp
 
+if TYPE_CHECKING:
+    from getit.mcp.server import ServerContext
 
-async def _ensure_services_ready() -> None:
-    """Ensure TaskRegistry is connected and DownloadService is started."""
-    ctx = get_context()
+
+async def _ensure_services_ready(ctx: ServerContext | None = None) -> None:
+    """Ensure TaskRegistry is connected and DownloadService is started.
+
+    Args:
+        ctx: Server context to use; defaults to the current context
+    """
+    if ctx is None:
+        ctx = get_context()
 
     # Connect TaskRegistry if not already connected
     if ctx.task_registry._db is None:
@@ -43,9 +51,9 @@ async def download(
     Returns:
         Dictionary with task_id of the created download task
     """
-    await _ensure_services_ready()
-
     ctx = get_context()
+    await _ensure_services_ready(ctx)
+
     if not ctx.download_service:
         raise RuntimeError("DownloadService not initialized")
 
@@ -66,9 +74,9 @@ async def list_files(url: str, password: str | None = None) -> dict[str, list[di
     Returns:
         Dictionary with "files" key containing list of file information dicts
     """
-    await _ensure_services_ready()
-
     ctx = get_context()
+    await _ensure_services_ready(ctx)
+
     if not ctx.download_service:
         raise RuntimeError("DownloadService not initialized")
 
@@ -109,9 +117,9 @@ async def get_download_status(task_id: str) -> dict[str, Any]:
     Raises:
         ValueError: If task_id is not found
     """
-    await _ensure_services_ready()
-
     ctx = get_context()
+    await _ensure_services_ready(ctx)
+
     task_info = await ctx.task_registry.get_task(task_id)
 
     if task_info is None:
@@ -139,9 +147,9 @@ async def cancel_download(task_id: str) -> dict[str, bool]:
     Returns:
         Dictionary with "success" key indicating if cancellation was successful
     """
-    await _ensure_services_ready()
-
     ctx = get_context()
+    await _ensure_services_ready(ctx)
+
     if not ctx.download_service:
         raise RuntimeError("DownloadService not initialized")
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+from getit.utils.url import ALLOWED_SCHEMES, parse_url
+
 if TYPE_CHECKING:
     from getit.extractors.base import BaseExtractor
 
@@ -18,9 +21,18 @@ class ExtractorRegistry:
     """Registry for managing file host extractors with self-registration.
 
     Provides decorator-based registration and URL-based lookups.
+
+    get_for_url() results are cached, so _extractors, _domain_index and
+    _unindexed must only be changed through register() and _reset(). Code
+    that changes or rebinds them any other way, such as a test fixture,
+    must call clear_lookup_cache() afterwards or lookups go stale.
     """
 
     _extractors: dict[str, type[BaseExtractor]] = {}
+    # Lower-cased SUPPORTED_DOMAINS entry -> extractors declaring it, in
+    # registration order; extractors without domains are always consulted.
+    _domain_index: dict[str, list[type[BaseExtractor]]] = {}
+    _unindexed: list[type[BaseExtractor]] = []
 
     @classmethod
     def register(cls, extractor_cls: type[BaseExtractor]) -> type[BaseExtractor]:
@@ -36,12 +48,19 @@ class ExtractorRegistry:
             RegistrationError: If an extractor with the same name is already registered.
         """
         name = extractor_cls.EXTRACTOR_NAME
+        # Plain membership test, and before any index is touched, so a
+        # rejected class leaves no trace in the lookup structures
         if name in cls._extractors:
             raise RegistrationError(
                 f"Extractor '{name}' is already registered. "
                 f"Cannot register {extractor_cls.__name__}."
             )
         cls._extractors[name] = extractor_cls
+        for domain in extractor_cls.SUPPORTED_DOMAINS:
+            cls._domain_index.setdefault(domain.lower(), []).append(extractor_cls)
+        if not extractor_cls.SUPPORTED_DOMAINS:
+            cls._unindexed.append(extractor_cls)
+        cls.clear_lookup_cache()
         return extractor_cls
 
     @classmethod
@@ -66,11 +85,32 @@ class ExtractorRegistry:
         return list(cls._extractors.values())
 
     @classmethod
+    def clear_lookup_cache(cls) -> None:
+        """Forget cached get_for_url() results.
+
+        register() calls this itself; call it after changing the registry's
+        contents any other way.
+        """
+        cls.get_for_url.cache_clear()
+
+    @classmethod
+    def _reset(cls) -> None:
+        """Drop every registration along with the lookup index and cache."""
+        cls._extractors.clear()
+        cls._domain_index.clear()
+        cls._unindexed.clear()
+        cls.clear_lookup_cache()
+
+    @classmethod
+    @lru_cache(maxsize=1024)
     def get_for_url(cls, url: str) -> type[BaseExtractor] | None:
         """Find extractor that can handle a URL.
 
-        Iterates through registered extractors and returns the first one
-        whose can_handle() method returns True for the given URL.
+        Looks up the URL's host and each of its parent domains in the
+        domain index (most specific first) and returns the first candidate
+        whose can_handle() method returns True for the given URL. URLs that
+        are not http(s) or have no host are rejected up front. Results are
+        cached per URL until the next registration.
 
         Args:
             url: URL to find an extractor for.
@@ -78,7 +118,18 @@ class ExtractorRegistry:
         Returns:
             Extractor class or None if no extractor can handle the URL.
         """
-        for extractor in cls._extractors.values():
+        parsed = parse_url(url)
+        if parsed.scheme.lower() not in ALLOWED_SCHEMES or not parsed.netloc:
+            return None
+
+        host = parsed.hostname or ""
+        while host:
+            for extractor in cls._domain_index.get(host, ()):
+                if extractor.can_handle(url):
+                    return extractor
+            _, _, host = host.partition(".")
+
+        for extractor in cls._unindexed:
             if extractor.can_handle(url):
                 return extractor
         return None
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 import uuid
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -43,10 +44,17 @@ class TaskInfo:
 
 
 class TaskRegistry:
+    # Pass as db_path for a private database that lives only as long as the
+    # connection; nothing is written to disk
+    IN_MEMORY: Path = Path(":memory:")
     BUSY_TIMEOUT_MS: int = 30000
     PRAGMA_SYNCHRONOUS: str = "NORMAL"
     PRAGMA_JOURNAL_MODE: str = "WAL"
     CONFIG_PERMISSIONS: int = 0o600
+    _INSERT_TASK_SQL: str = """
+        INSERT INTO tasks (task_id, url, output_dir, status, progress, error, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
 
     def __init__(self, db_path: Path | None = None):
         self.db_path = db_path or (get_default_config_dir() / "tasks.db")
@@ -60,6 +68,12 @@ class TaskRegistry:
         await self.close()
 
     async def connect(self) -> None:
+        if self.db_path == self.IN_MEMORY:
+            self._db = await aiosqlite.connect(":memory:", timeout=self.BUSY_TIMEOUT_MS / 1000.0)
+            await self._configure_pragmas()
+            await self._create_tables()
+            return
+
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         db_existed = self.db_path.exists()
@@ -130,27 +144,28 @@ class TaskRegistry:
         if not self._db:
             raise RuntimeError("Database not connected")
 
-        task_id = str(uuid.uuid4())
-        now = datetime.now()
+        row = self._new_task_row(url, output_dir, datetime.now())
+        await self._db.execute(self._INSERT_TASK_SQL, row)
+        await self._db.commit()
+        return row[0]
 
-        await self._db.execute(
-            """
-            INSERT INTO tasks (task_id, url, output_dir, status, progress, error, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                task_id,
-                url,
-                str(output_dir),
-                TaskStatus.PENDING.value,
-                json.dumps({}),
-                None,
-                now.isoformat(),
-                now.isoformat(),
-            ),
-        )
+    async def create_tasks(self, entries: Iterable[tuple[str, Path]]) -> list[str]:
+        """Create several PENDING tasks in one transaction.
+
+        Args:
+            entries: (url, output_dir) pairs, one per task
+
+        Returns:
+            The new task IDs, in the order of entries
+        """
+        if not self._db:
+            raise RuntimeError("Database not connected")
+
+        now = datetime.now()
+        rows = [self._new_task_row(url, output_dir, now) for url, output_dir in entries]
+        await self._db.executemany(self._INSERT_TASK_SQL, rows)
         await self._db.commit()
-        return task_id
+        return [row[0] for row in rows]
 
     async def get_task(self, task_id: str) -> TaskInfo | None:
         if not self._db:
@@ -245,3 +260,16 @@ class TaskRegistry:
             created_at=datetime.fromisoformat(row[6]),
             updated_at=datetime.fromisoformat(row[7]),
         )
+
+    @staticmethod
+    def _new_task_row(url: str, output_dir: Path, now: datetime) -> tuple[Any, ...]:
+        return (
+            str(uuid.uuid4()),
+            url,
+            str(output_dir),
+            TaskStatus.PENDING.value,
+            json.dumps({}),
+            None,
+            now.isoformat(),
+            now.isoformat(),
+        )
@@ -0,0 +1,17 @@
+"""URL parsing helpers shared by the extractor registry and extractors."""
+
+from functools import lru_cache
+from urllib.parse import ParseResult, urlparse
+
+ALLOWED_SCHEMES = frozenset({"http", "https"})
+
+
+@lru_cache(maxsize=1024)
+def parse_url(url: str) -> ParseResult:
+    """Parse a URL, reusing the result for URLs seen recently.
+
+    A lookup runs every extractor's can_handle() on the same URL, so caching
+    turns those repeated parses into a single one. ParseResult is an
+    immutable tuple, so sharing it between callers is safe.
+    """
+    return urlparse(url)
@@ -184,6 +184,9 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "slow: mark test as slow running")
     config.addinivalue_line("markers", "integration: mark test as integration test")
     config.addinivalue_line("markers", "live: mark test as requiring live network access")
+    config.addinivalue_line(
+        "markers", "mcp_registration: mark test as inspecting the FastMCP registry"
+    )
 
 
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
@@ -101,8 +101,7 @@ async def mcp_context(temp_dirs) -> AsyncGenerator[ServerContext, None]:
     ctx.task_registry = task_registry
     ctx.download_service = cast(DownloadService, fake_service)
 
-    original_context = server_module._context
-    server_module._context = ctx
+    token = server_module._context.set(ctx)
 
     import getit.mcp.prompts  # noqa: F401
     import getit.mcp.resources  # noqa: F401
@@ -111,7 +110,7 @@ async def mcp_context(temp_dirs) -> AsyncGenerator[ServerContext, None]:
     yield ctx
 
     await task_registry.close()
-    server_module._context = original_context
+    server_module._context.reset(token)
 
 
 def get_tool_result(result):
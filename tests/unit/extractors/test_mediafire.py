@@ -38,7 +38,7 @@ class TestMediaFireExtractor:
 class TestMediaFirePacer:
     def test_pacer_initialized(self, mock_http):
         extractor = MediaFireExtractor(mock_http)
-        assert hasattr(extractor, "_pacer")
+        assert extractor._pacer is not None
         assert extractor._pacer.min_backoff == 0.4
         assert extractor._pacer.max_backoff == 5.0
         assert extractor._pacer.flood_sleep == 30.0
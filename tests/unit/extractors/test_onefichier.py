@@ -14,6 +14,11 @@ def mock_http():
     return MagicMock(spec=HTTPClient)
 
 
+@pytest.fixture
+def extractor(mock_http):
+    return OneFichierExtractor(mock_http)
+
+
 class TestOneFichierExtractor:
     def test_extractor_name(self):
         assert OneFichierExtractor.EXTRACTOR_NAME == "1fichier"
@@ -35,63 +40,40 @@ class TestOneFichierExtractor:
 
 
 class TestOneFichierPacer:
-    def test_pacer_initialized(self, mock_http):
-        extractor = OneFichierExtractor(mock_http)
-        assert hasattr(extractor, "_pacer")
-        assert extractor._pacer.min_backoff == 0.4
-        assert extractor._pacer.max_backoff == 5.0
-        assert extractor._pacer.flood_sleep == 30.0
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [("min_backoff", 0.4), ("max_backoff", 5.0), ("flood_sleep", 30.0)],
+    )
+    def test_pacer_initialized(self, extractor, attr, expected):
+        assert extractor._pacer is not None
+        assert getattr(extractor._pacer, attr) == expected
 
 
 class TestOneFichierFloodDetection:
-    def test_detect_flood_ip_lock(self, mock_http):
-        extractor = OneFichierExtractor(mock_http)
-        flood_html = "<html>Your IP has been locked due to too many requests</html>"
-        assert extractor._pacer.detect_flood_ip_lock(flood_html)
-
-    def test_detect_too_many_connections(self, mock_http):
-        extractor = OneFichierExtractor(mock_http)
-        flood_html = "<html>Too many connections from your IP</html>"
-        assert extractor._pacer.detect_flood_ip_lock(flood_html)
-
-    def test_no_flood_detection(self, mock_http):
-        extractor = OneFichierExtractor(mock_http)
-        normal_html = "<html>Download your file</html>"
-        assert not extractor._pacer.detect_flood_ip_lock(normal_html)
+    @pytest.mark.parametrize(
+        "html,expected",
+        [
+            ("<html>Your IP has been locked due to too many requests</html>", True),
+            ("<html>Too many connections from your IP</html>", True),
+            ("<html>Download your file</html>", False),
+        ],
+    )
+    def test_detect_flood_ip_lock(self, extractor, html, expected):
+        assert extractor._pacer.detect_flood_ip_lock(html) is expected
 
 
 class TestOneFichierWaitTimeParsing:
-    def test_parse_wait_time_seconds(self, mock_http):
-        extractor = OneFichierExtractor(mock_http)
-        wait_html = "<html>Please wait 30 seconds</html>"
-        wait_time = extractor._pacer.parse_wait_time(wait_html)
-        assert wait_time == 30.0
-
-    def test_parse_wait_time_minutes(self, mock_http):
-        extractor = OneFichierExtractor(mock_http)
-        wait_html = "<html>You must wait 2 minutes</html>"
-        wait_time = extractor._pacer.parse_wait_time(wait_html)
-        assert wait_time == 120.0
-
-    def test_parse_wait_time_javascript(self, mock_http):
-        extractor = OneFichierExtractor(mock_http)
-        wait_html = "<html>var wait = 45;</html>"
-        wait_time = extractor._pacer.parse_wait_time(wait_html)
-        assert wait_time == 45.0
-
-    def test_parse_no_wait_time(self, mock_http):
-        extractor = OneFichierExtractor(mock_http)
-        normal_html = "<html>Download now</html>"
-        wait_time = extractor._pacer.parse_wait_time(normal_html)
-        assert wait_time is None
-
-
-class TestOneFichierRetryLogic:
-    @pytest.mark.asyncio
-    async def test_extractor_initializes_pacer(self, mock_http):
-        extractor = OneFichierExtractor(mock_http)
-        assert hasattr(extractor, "_pacer")
-        assert extractor._pacer.min_backoff == 0.4
+    @pytest.mark.parametrize(
+        "html,expected",
+        [
+            ("<html>Please wait 30 seconds</html>", 30.0),
+            ("<html>You must wait 2 minutes</html>", 120.0),
+            ("<html>var wait = 45;</html>", 45.0),
+            ("<html>Download now</html>", None),
+        ],
+    )
+    def test_parse_wait_time(self, extractor, html, expected):
+        assert extractor._pacer.parse_wait_time(html) == expected
 
 
 class TestOneFichierPasswordRequired:
@@ -106,11 +88,12 @@ class TestOneFichierPasswordRequired:
 
 
 class TestOneFichierURLPatterns:
-    def test_extract_id_from_url(self, mock_http):
-        assert OneFichierExtractor.extract_id("https://1fichier.com/?abc123") == "abc123"
-
-    def test_extract_id_from_alt_format(self, mock_http):
-        assert OneFichierExtractor.extract_id("https://abc123.1fichier.com") == "abc123"
+    @pytest.mark.parametrize(
+        "url",
+        ["https://1fichier.com/?abc123", "https://abc123.1fichier.com"],
+    )
+    def test_extract_id(self, url):
+        assert OneFichierExtractor.extract_id(url) == "abc123"
 
 
 class TestOneFichierProxyPassthrough:
@@ -119,13 +102,6 @@ class TestOneFichierProxyPassthrough:
         assert extractor.http is mock_http
 
 
-class TestOneFichierRangeResume:
-    @pytest.mark.asyncio
-    async def test_extractor_supports_resume(self, mock_http):
-        extractor = OneFichierExtractor(mock_http)
-        assert extractor._pacer is not None
-
-
 class TestOneFichierBackoffCalculation:
     def test_backoff_increments_exponentially(self, mock_http):
         extractor = OneFichierExtractor(mock_http)
@@ -1,7 +1,10 @@
 """Tests for PixelDrain extractor."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
 
+import aiohttp
 import pytest
 from multidict import CIMultiDict, CIMultiDictProxy
 
@@ -15,6 +18,22 @@ def mock_http():
     return MagicMock(spec=HTTPClient)
 
 
+_FAKE_REQUEST_INFO = cast(
+    aiohttp.RequestInfo, SimpleNamespace(real_url="", method="GET", headers={}, url="")
+)
+_RATE_LIMIT_ERROR = aiohttp.ClientResponseError(
+    request_info=_FAKE_REQUEST_INFO,
+    history=(),
+    status=429,
+    message="Too many requests",
+    headers=CIMultiDictProxy(CIMultiDict({"Retry-After": "1.0"})),
+)
+
+
+async def _raise_rate_limit(*args, **kwargs):
+    raise _RATE_LIMIT_ERROR
+
+
 class TestPixelDrainExtractor:
     def test_extractor_name(self):
         """PixelDrainExtractor has correct name."""
@@ -49,29 +68,20 @@ class TestPixelDrainExtractor:
 
 
 class TestPixelDrainURLExtraction:
-    def test_extract_id_from_file_url(self):
-        """Extract ID from file URL."""
-        assert PixelDrainExtractor.extract_id("https://pixeldrain.com/u/abc123") == "abc123"
-
-    def test_extract_id_from_list_url(self):
-        """Extract ID from list URL."""
-        assert PixelDrainExtractor.extract_id("https://pixeldrain.com/l/xyz789") == "xyz789"
-
-    def test_extract_id_from_api_url(self):
-        """Extract ID from API URL."""
-        assert PixelDrainExtractor.extract_id("https://pixeldrain.com/api/file/def456") == "def456"
-
-    def test_extract_type_from_file_url(self):
-        """Extract type 'u' from file URL."""
-        assert PixelDrainExtractor._extract_type("https://pixeldrain.com/u/abc123") == "u"
-
-    def test_extract_type_from_list_url(self):
-        """Extract type 'l' from list URL."""
-        assert PixelDrainExtractor._extract_type("https://pixeldrain.com/l/xyz789") == "l"
-
-    def test_extract_id_invalid_url(self):
-        """Extract ID returns None for invalid URL."""
-        assert PixelDrainExtractor.extract_id("https://example.com/file") is None
+    @pytest.mark.parametrize(
+        "url,expected_id,expected_type",
+        [
+            ("https://pixeldrain.com/u/abc123", "abc123", "u"),
+            ("https://pixeldrain.com/l/xyz789", "xyz789", "l"),
+            ("https://pixeldrain.com/api/file/def456", "def456", None),
+            ("https://example.com/file", None, None),
+        ],
+    )
+    def test_url_parsing(self, url, expected_id, expected_type):
+        """Extract ID (and type, where applicable) from PixelDrain URLs."""
+        assert PixelDrainExtractor.extract_id(url) == expected_id
+        if expected_type is not None:
+            assert PixelDrainExtractor._extract_type(url) == expected_type
 
 
 class TestPixelDrainRateLimiting:
@@ -109,18 +119,8 @@ class TestPixelDrainRateLimiting:
         Rate limit handling and retries are handled by the Pacer/HTTPClient
         at a higher level. The extractor should propagate the error.
         """
-        import aiohttp
-
         extractor = PixelDrainExtractor(mock_http)
-
-        error = aiohttp.ClientResponseError(
-            request_info=MagicMock(),
-            history=(),
-            status=429,
-            message="Too many requests",
-            headers=CIMultiDictProxy(CIMultiDict({"Retry-After": "1.0"})),
-        )
-        mock_http.get_json = AsyncMock(side_effect=error)
+        mock_http.get_json = _raise_rate_limit
 
         with pytest.raises(aiohttp.ClientResponseError) as exc_info:
             await extractor._get_file_info("abc123")
@@ -181,11 +181,7 @@ class TestPixelDrainProxyPassthrough:
             }
         )
 
-        # Mock HTTPClient to check proxy configuration
-        with patch.dict("os.environ", {"HTTPS_PROXY": "http://proxy.example.com:8080"}):
-            # Re-create extractor to pick up env var
-            extractor = PixelDrainExtractor(mock_http)
-            await extractor._get_file_info("abc123")
+        await extractor._get_file_info("abc123")
 
         # Verify HTTPClient's proxy configuration is used
         assert mock_http.get_json.called
@@ -245,11 +241,10 @@ class TestPixelDrainExtraction:
 
         files = await extractor.extract("https://pixeldrain.com/l/xyz789")
 
-        assert len(files) == 2
-        assert files[0].filename == "test1.txt"
-        assert files[1].filename == "test2.txt"
-        assert files[0].parent_folder == "My List"
-        assert files[1].parent_folder == "My List"
+        assert [(f.filename, f.parent_folder) for f in files] == [
+            ("test1.txt", "My List"),
+            ("test2.txt", "My List"),
+        ]
 
     @pytest.mark.asyncio
     async def test_extract_folder(self, mock_http):
@@ -275,9 +270,7 @@ class TestPixelDrainExtraction:
         folder = await extractor.extract_folder("https://pixeldrain.com/l/xyz789")
 
         assert folder is not None
-        assert folder.name == "My Folder"
-        assert len(folder.files) == 1
-        assert folder.files[0].filename == "test1.txt"
+        assert (folder.name, [f.filename for f in folder.files]) == ("My Folder", ["test1.txt"])
 
     @pytest.mark.asyncio
     async def test_extract_file_not_found(self, mock_http):
@@ -2,11 +2,44 @@
 
 from __future__ import annotations
 
+import re
+
 import pytest
+import pytest_asyncio
 
 from getit.mcp.prompts import download_workflow
 from getit.mcp.server import mcp
 
+_REQUIRED_STEPS = (
+    "URL Input",
+    "Provider Detection",
+    "Password Handling",
+    "Output Directory",
+    "Download Confirmation",
+)
+_PROVIDERS = ("GoFile", "PixelDrain", "MediaFire", "1Fichier", "Mega.nz")
+# Longest names first so "download" doesn't shadow the tools that contain it.
+_TOOLS = ("get_download_status", "cancel_download", "download")
+
+
+def _alternation(words: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(map(re.escape, words)))
+
+
+_STEPS_RE = _alternation(_REQUIRED_STEPS)
+_PROVIDERS_RE = _alternation(_PROVIDERS)
+_TOOLS_RE = _alternation(_TOOLS)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def registered_prompts():
+    return await mcp.list_prompts()
+
+
+@pytest.fixture(scope="module")
+def prompt_names_set(registered_prompts) -> frozenset[str]:
+    return frozenset(p.name for p in registered_prompts)
+
 
 class TestDownloadWorkflowPrompt:
     def test_download_workflow_returns_string(self):
@@ -18,47 +51,32 @@ class TestDownloadWorkflowPrompt:
     def test_download_workflow_contains_workflow_steps(self):
         """Verify prompt contains key workflow steps."""
         result = download_workflow()
-        assert "URL Input" in result
-        assert "Provider Detection" in result
-        assert "Password Handling" in result
-        assert "Output Directory" in result
-        assert "Download Confirmation" in result
+        assert set(_STEPS_RE.findall(result)) == set(_REQUIRED_STEPS)
 
     def test_download_workflow_mentions_supported_providers(self):
         """Verify prompt mentions all supported providers."""
         result = download_workflow()
-        providers = ["GoFile", "PixelDrain", "MediaFire", "1Fichier", "Mega.nz"]
-        for provider in providers:
-            assert provider in result
+        assert set(_PROVIDERS_RE.findall(result)) == set(_PROVIDERS)
 
     def test_download_workflow_includes_tool_references(self):
         """Verify prompt mentions available tools."""
         result = download_workflow()
-        assert "download" in result
-        assert "get_download_status" in result
-        assert "cancel_download" in result
+        assert set(_TOOLS_RE.findall(result)) == set(_TOOLS)
 
-    @pytest.mark.asyncio
-    async def test_download_workflow_prompt_registered(self):
+    def test_download_workflow_prompt_registered(self, prompt_names_set):
         """Verify download_workflow prompt is registered with mcp."""
-        prompts = await mcp.list_prompts()
-        prompt_names = [p.name for p in prompts]
-        assert "download_workflow" in prompt_names
+        assert "download_workflow" in prompt_names_set
 
-    @pytest.mark.asyncio
-    async def test_download_workflow_prompt_has_metadata(self):
+    def test_download_workflow_prompt_has_metadata(self, registered_prompts):
         """Verify download_workflow prompt has proper metadata."""
-        prompts = await mcp.list_prompts()
-        workflow_prompt = None
-        for p in prompts:
-            if p.name == "download_workflow":
-                workflow_prompt = p
-                break
+        workflow_prompt = next(
+            (p for p in registered_prompts if p.name == "download_workflow"), None
+        )
 
         assert workflow_prompt is not None
         assert workflow_prompt.name == "download_workflow"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_prompt_returns_download_workflow(self):
         """Verify get_prompt method returns download_workflow content."""
         result = await mcp.get_prompt("download_workflow")
@@ -69,6 +87,6 @@ class TestDownloadWorkflowPrompt:
     def test_download_workflow_is_concise_but_complete(self):
         """Verify prompt is structured and not overly verbose."""
         result = download_workflow()
-        lines = result.strip().split("\n")
-        assert 20 <= len(lines) <= 100
-        assert "##" in result or "#" in result
+        n_lines = result.strip().count("\n") + 1
+        assert 20 <= n_lines <= 100
+        assert "#" in result
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import gc
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, call, patch
 
 import pytest
+from pydantic.networks import AnyUrl
 
-from getit.events import DOWNLOAD_COMPLETE, DOWNLOAD_ERROR, DOWNLOAD_PROGRESS
+from getit.events import DOWNLOAD_COMPLETE, DOWNLOAD_ERROR, DOWNLOAD_PROGRESS, EventBus
 from getit.mcp.resources import (
     ACTIVE_DOWNLOADS_URI,
     _on_download_event,
@@ -15,29 +18,55 @@ from getit.mcp.resources import (
     active_downloads,
     handle_subscribe,
     handle_unsubscribe,
+    list_active_downloads,
 )
-from getit.mcp.server import ServerContext
-from getit.tasks import TaskInfo, TaskRegistry, TaskStatus
+from getit.mcp.server import ServerContext, mcp
+from getit.tasks import TaskInfo, TaskStatus
 
+# Share one event loop across the module instead of creating one per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-def mock_context():
+_EXPECTED_SUBSCRIBE_CALLS = [
+    call(DOWNLOAD_PROGRESS, _on_download_event),
+    call(DOWNLOAD_COMPLETE, _on_download_event),
+    call(DOWNLOAD_ERROR, _on_download_event),
+]
+
+
+@pytest.fixture(scope="session")
+def _mock_context_skeleton():
     ctx = ServerContext()
+    ctx.event_bus = EventBus()
+    return ctx
+
+
+@pytest.fixture
+def mock_context(_mock_context_skeleton):
+    # Keep the context object, swap in fresh mocks so no configured return
+    # value carries over from a previous test
+    ctx = _mock_context_skeleton
     ctx.download_service = AsyncMock()
     ctx.download_service._manager = MagicMock()
-    ctx.task_registry = AsyncMock(spec=TaskRegistry)
+    ctx.task_registry = AsyncMock()
     ctx.task_registry._db = MagicMock()
-    return ctx
+    with patch.object(EventBus, "subscribe"):
+        yield ctx
 
 
-@pytest.fixture(autouse=True)
-def setup_context(mock_context):
-    with (
-        patch("getit.mcp.resources.get_context", return_value=mock_context),
-        patch("getit.mcp.tools.get_context", return_value=mock_context),
-    ):
-        mock_context.event_bus.subscribe = MagicMock()
-        yield mock_context
+class _RequestContextController:
+    """Points the patched ``request_context`` at a given client session."""
+
+    def __init__(self, prop: PropertyMock) -> None:
+        self._prop = prop
+
+    def set(self, session) -> None:
+        self._prop.return_value.session = session
+
+
+@pytest.fixture
+def request_context_patch():
+    with patch.object(type(mcp._mcp_server), "request_context", new_callable=PropertyMock) as prop:
+        yield _RequestContextController(prop)
 
 
 @pytest.fixture(autouse=True)
@@ -52,15 +81,13 @@ def reset_module_state():
 
 
 class TestActiveDownloadsResource:
-    @pytest.mark.asyncio
     async def test_returns_empty_list_when_no_active_tasks(self, mock_context):
         mock_context.task_registry.list_active.return_value = []
 
-        result = await active_downloads()
+        result = await list_active_downloads(mock_context)
 
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_returns_list_of_active_tasks(self, mock_context):
         task1 = TaskInfo(
             task_id="task-1",
@@ -78,7 +105,7 @@ class TestActiveDownloadsResource:
         )
         mock_context.task_registry.list_active.return_value = [task1, task2]
 
-        result = await active_downloads()
+        result = await list_active_downloads(mock_context)
 
         assert len(result) == 2
         assert result[0]["task_id"] == "task-1"
@@ -87,7 +114,6 @@ class TestActiveDownloadsResource:
         assert result[1]["task_id"] == "task-2"
         assert result[1]["status"] == "pending"
 
-    @pytest.mark.asyncio
     async def test_converts_all_task_fields_to_dict(self, mock_context):
         task = TaskInfo(
             task_id="task-123",
@@ -99,7 +125,7 @@ class TestActiveDownloadsResource:
         )
         mock_context.task_registry.list_active.return_value = [task]
 
-        result = await active_downloads()
+        result = await list_active_downloads(mock_context)
 
         assert len(result) == 1
         task_dict = result[0]
@@ -112,7 +138,6 @@ class TestActiveDownloadsResource:
         assert "created_at" in task_dict
         assert "updated_at" in task_dict
 
-    @pytest.mark.asyncio
     async def test_formats_datetimes_as_isoformat(self, mock_context):
         task = TaskInfo(
             task_id="task-123",
@@ -124,12 +149,11 @@ class TestActiveDownloadsResource:
         )
         mock_context.task_registry.list_active.return_value = [task]
 
-        result = await active_downloads()
+        result = await list_active_downloads(mock_context)
 
         assert result[0]["created_at"] == "2024-01-01T12:00:00"
         assert result[0]["updated_at"] == "2024-01-01T12:30:00"
 
-    @pytest.mark.asyncio
     async def test_ensures_services_ready_before_listing(self, mock_context):
         mock_context.task_registry._db = None
         mock_context.task_registry.connect = AsyncMock()
@@ -137,39 +161,41 @@ class TestActiveDownloadsResource:
         mock_context.download_service.start = AsyncMock()
         mock_context.task_registry.list_active.return_value = []
 
-        await active_downloads()
+        await list_active_downloads(mock_context)
 
         mock_context.task_registry.connect.assert_called_once()
         mock_context.download_service.start.assert_called_once()
 
 
 class TestEventHandlerRegistration:
-    @pytest.mark.asyncio
     async def test_registers_event_handlers_once(self, mock_context):
-        await _register_event_handlers()
-        await _register_event_handlers()
+        await _register_event_handlers(mock_context)
+        await _register_event_handlers(mock_context)
 
-        assert mock_context.event_bus.subscribe.call_count == 3
+        assert mock_context.event_bus.subscribe.call_args_list == _EXPECTED_SUBSCRIBE_CALLS
+
+    async def test_concurrent_registration_registers_once(self, mock_context):
+        await asyncio.gather(
+            _register_event_handlers(mock_context), _register_event_handlers(mock_context)
+        )
 
-        calls = [c[0][0] for c in mock_context.event_bus.subscribe.call_args_list]
-        assert DOWNLOAD_PROGRESS in calls
-        assert DOWNLOAD_COMPLETE in calls
-        assert DOWNLOAD_ERROR in calls
+        assert mock_context.event_bus.subscribe.call_count == 3
 
-    @pytest.mark.asyncio
     async def test_registers_same_callback_for_all_events(self, mock_context):
-        await _register_event_handlers()
+        await _register_event_handlers(mock_context)
 
-        callbacks = [c[0][1] for c in mock_context.event_bus.subscribe.call_args_list]
-        assert all(cb == _on_download_event for cb in callbacks)
+        assert {c.args[1] for c in mock_context.event_bus.subscribe.call_args_list} == {
+            _on_download_event
+        }
 
 
 class TestDownloadEventNotification:
-    @pytest.mark.asyncio
     async def test_does_nothing_when_no_subscribed_sessions(self):
-        await _on_download_event({"task_id": "test"})
+        with patch("getit.mcp.resources.asyncio.gather") as mock_gather:
+            await _on_download_event({"task_id": "test"})
+
+        mock_gather.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_notifies_all_subscribed_sessions(self):
         session1 = AsyncMock()
         session2 = AsyncMock()
@@ -181,7 +207,6 @@ class TestDownloadEventNotification:
         session1.send_resource_updated.assert_called_once()
         session2.send_resource_updated.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_continues_on_notification_error(self):
         session1 = AsyncMock()
         session2 = AsyncMock()
@@ -194,113 +219,95 @@ class TestDownloadEventNotification:
         session2.send_resource_updated.assert_called_once()
         assert session1 not in _subscribed_sessions
 
+    async def test_notifies_sessions_concurrently(self):
+        arrived = 0
+        all_arrived = asyncio.Event()
+
+        async def rendezvous(uri):
+            nonlocal arrived
+            arrived += 1
+            if arrived == 2:
+                all_arrived.set()
+            await all_arrived.wait()
+
+        session1 = AsyncMock()
+        session2 = AsyncMock()
+        session1.send_resource_updated.side_effect = rendezvous
+        session2.send_resource_updated.side_effect = rendezvous
+        _subscribed_sessions.add(session1)
+        _subscribed_sessions.add(session2)
+
+        await asyncio.wait_for(_on_download_event({"task_id": "test"}), timeout=1)
+
+        assert arrived == 2
+
+    async def test_gc_collects_dropped_sessions(self):
+        session = AsyncMock()
+        _subscribed_sessions.add(session)
+        assert len(_subscribed_sessions) == 1
+
+        del session
+        gc.collect()
+
+        assert len(_subscribed_sessions) == 0
 
-class TestSubscribeHandler:
-    @pytest.mark.asyncio
-    async def test_ignores_non_matching_uri(self, mock_context):
-        from getit.mcp.server import mcp
 
+class TestSubscribeHandler:
+    async def test_ignores_non_matching_uri(self, mock_context, request_context_patch):
         mock_session = AsyncMock()
-        mock_request_context = MagicMock()
-        mock_request_context.session = mock_session
+        request_context_patch.set(mock_session)
 
-        with patch.object(
-            type(mcp._mcp_server),
-            "request_context",
-            new_callable=PropertyMock,
-            return_value=mock_request_context,
-        ):
-            await handle_subscribe("other://uri")
+        await handle_subscribe("other://uri", ctx=mock_context)
 
         assert mock_session not in _subscribed_sessions
 
-    @pytest.mark.asyncio
-    async def test_adds_session_to_subscribers(self, mock_context):
-        from getit.mcp.server import mcp
-
+    async def test_adds_session_to_subscribers(self, mock_context, request_context_patch):
         mock_session = AsyncMock()
-        mock_request_context = MagicMock()
-        mock_request_context.session = mock_session
+        request_context_patch.set(mock_session)
 
-        with patch.object(
-            type(mcp._mcp_server),
-            "request_context",
-            new_callable=PropertyMock,
-            return_value=mock_request_context,
-        ):
-            await handle_subscribe(ACTIVE_DOWNLOADS_URI)
+        await handle_subscribe(ACTIVE_DOWNLOADS_URI, ctx=mock_context)
 
         assert mock_session in _subscribed_sessions
 
-    @pytest.mark.asyncio
-    async def test_ensures_services_ready_before_subscribing(self, mock_context):
-        from getit.mcp.server import mcp
+    async def test_accepts_any_url_from_mcp_server(self, mock_context, request_context_patch):
+        mock_session = AsyncMock()
+        request_context_patch.set(mock_session)
 
+        await handle_subscribe(AnyUrl(ACTIVE_DOWNLOADS_URI), ctx=mock_context)
+
+        assert mock_session in _subscribed_sessions
+
+    async def test_ensures_services_ready_before_subscribing(
+        self, mock_context, request_context_patch
+    ):
         mock_context.task_registry._db = None
         mock_context.task_registry.connect = AsyncMock()
         mock_context.download_service._manager = None
         mock_context.download_service.start = AsyncMock()
+        request_context_patch.set(AsyncMock())
 
-        mock_session = AsyncMock()
-        mock_request_context = MagicMock()
-        mock_request_context.session = mock_session
-
-        with patch.object(
-            type(mcp._mcp_server),
-            "request_context",
-            new_callable=PropertyMock,
-            return_value=mock_request_context,
-        ):
-            await handle_subscribe(ACTIVE_DOWNLOADS_URI)
+        await handle_subscribe(ACTIVE_DOWNLOADS_URI, ctx=mock_context)
 
         mock_context.task_registry.connect.assert_called_once()
         mock_context.download_service.start.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_registers_event_handlers_on_first_subscription(self, mock_context):
-        from getit.mcp.server import mcp
-
-        mock_session = AsyncMock()
-        mock_request_context = MagicMock()
-        mock_request_context.session = mock_session
+    async def test_registers_event_handlers_on_first_subscription(
+        self, mock_context, request_context_patch
+    ):
+        request_context_patch.set(AsyncMock())
 
-        with patch.object(
-            type(mcp._mcp_server),
-            "request_context",
-            new_callable=PropertyMock,
-            return_value=mock_request_context,
-        ):
-            await handle_subscribe(ACTIVE_DOWNLOADS_URI)
+        await handle_subscribe(ACTIVE_DOWNLOADS_URI, ctx=mock_context)
 
         assert mock_context.event_bus.subscribe.call_count == 3
 
-    @pytest.mark.asyncio
-    async def test_multiple_sessions_can_subscribe(self, mock_context):
-        from getit.mcp.server import mcp
-
+    async def test_multiple_sessions_can_subscribe(self, mock_context, request_context_patch):
         session1 = AsyncMock()
         session2 = AsyncMock()
 
-        mock_request_context1 = MagicMock()
-        mock_request_context1.session = session1
-        mock_request_context2 = MagicMock()
-        mock_request_context2.session = session2
-
-        with patch.object(
-            type(mcp._mcp_server),
-            "request_context",
-            new_callable=PropertyMock,
-            return_value=mock_request_context1,
-        ):
-            await handle_subscribe(ACTIVE_DOWNLOADS_URI)
-
-        with patch.object(
-            type(mcp._mcp_server),
-            "request_context",
-            new_callable=PropertyMock,
-            return_value=mock_request_context2,
-        ):
-            await handle_subscribe(ACTIVE_DOWNLOADS_URI)
+        request_context_patch.set(session1)
+        await handle_subscribe(ACTIVE_DOWNLOADS_URI, ctx=mock_context)
+        request_context_patch.set(session2)
+        await handle_subscribe(ACTIVE_DOWNLOADS_URI, ctx=mock_context)
 
         assert session1 in _subscribed_sessions
         assert session2 in _subscribed_sessions
@@ -308,128 +315,81 @@ class TestSubscribeHandler:
 
 
 class TestUnsubscribeHandler:
-    @pytest.mark.asyncio
-    async def test_ignores_non_matching_uri(self):
-        from getit.mcp.server import mcp
-
+    async def test_ignores_non_matching_uri(self, request_context_patch):
         mock_session = AsyncMock()
         _subscribed_sessions.add(mock_session)
+        request_context_patch.set(mock_session)
 
-        mock_request_context = MagicMock()
-        mock_request_context.session = mock_session
-
-        with patch.object(
-            type(mcp._mcp_server),
-            "request_context",
-            new_callable=PropertyMock,
-            return_value=mock_request_context,
-        ):
-            await handle_unsubscribe("other://uri")
+        await handle_unsubscribe("other://uri")
 
         assert mock_session in _subscribed_sessions
 
-    @pytest.mark.asyncio
-    async def test_removes_session_from_subscribers(self):
-        from getit.mcp.server import mcp
-
+    async def test_removes_session_from_subscribers(self, request_context_patch):
         mock_session = AsyncMock()
         _subscribed_sessions.add(mock_session)
+        request_context_patch.set(mock_session)
 
-        mock_request_context = MagicMock()
-        mock_request_context.session = mock_session
-
-        with patch.object(
-            type(mcp._mcp_server),
-            "request_context",
-            new_callable=PropertyMock,
-            return_value=mock_request_context,
-        ):
-            await handle_unsubscribe(ACTIVE_DOWNLOADS_URI)
+        await handle_unsubscribe(ACTIVE_DOWNLOADS_URI)
 
         assert mock_session not in _subscribed_sessions
 
-    @pytest.mark.asyncio
-    async def test_safe_to_unsubscribe_when_not_subscribed(self):
-        from getit.mcp.server import mcp
-
+    async def test_accepts_any_url_from_mcp_server(self, request_context_patch):
         mock_session = AsyncMock()
-        mock_request_context = MagicMock()
-        mock_request_context.session = mock_session
+        _subscribed_sessions.add(mock_session)
+        request_context_patch.set(mock_session)
 
-        with patch.object(
-            type(mcp._mcp_server),
-            "request_context",
-            new_callable=PropertyMock,
-            return_value=mock_request_context,
-        ):
-            await handle_unsubscribe(ACTIVE_DOWNLOADS_URI)
+        await handle_unsubscribe(AnyUrl(ACTIVE_DOWNLOADS_URI))
 
         assert mock_session not in _subscribed_sessions
 
-    @pytest.mark.asyncio
-    async def test_only_removes_requesting_session(self):
-        from getit.mcp.server import mcp
+    async def test_safe_to_unsubscribe_when_not_subscribed(self, request_context_patch):
+        mock_session = AsyncMock()
+        request_context_patch.set(mock_session)
+
+        await handle_unsubscribe(ACTIVE_DOWNLOADS_URI)
 
+        assert mock_session not in _subscribed_sessions
+
+    async def test_only_removes_requesting_session(self, request_context_patch):
         session1 = AsyncMock()
         session2 = AsyncMock()
         _subscribed_sessions.add(session1)
         _subscribed_sessions.add(session2)
+        request_context_patch.set(session1)
 
-        mock_request_context = MagicMock()
-        mock_request_context.session = session1
-
-        with patch.object(
-            type(mcp._mcp_server),
-            "request_context",
-            new_callable=PropertyMock,
-            return_value=mock_request_context,
-        ):
-            await handle_unsubscribe(ACTIVE_DOWNLOADS_URI)
+        await handle_unsubscribe(ACTIVE_DOWNLOADS_URI)
 
         assert session1 not in _subscribed_sessions
         assert session2 in _subscribed_sessions
 
 
 class TestMCPResourceRegistration:
-    @pytest.mark.asyncio
     async def test_active_downloads_resource_registered(self):
-        from getit.mcp.server import mcp
-
         resources = [str(r.uri) for r in await mcp.list_resources()]
         assert ACTIVE_DOWNLOADS_URI in resources
 
-    @pytest.mark.asyncio
     async def test_resource_returns_list(self, mock_context):
         mock_context.task_registry.list_active.return_value = []
 
-        result = await active_downloads()
+        with patch("getit.mcp.resources.get_context", return_value=mock_context):
+            result = await active_downloads()
         assert result == []
 
 
 class TestSubscriptionLifecycle:
-    @pytest.mark.asyncio
-    async def test_full_subscribe_event_unsubscribe_flow(self, mock_context):
-        from getit.mcp.server import mcp
-
+    async def test_full_subscribe_event_unsubscribe_flow(self, mock_context, request_context_patch):
         mock_session = AsyncMock()
-        mock_request_context = MagicMock()
-        mock_request_context.session = mock_session
-
-        with patch.object(
-            type(mcp._mcp_server),
-            "request_context",
-            new_callable=PropertyMock,
-            return_value=mock_request_context,
-        ):
-            await handle_subscribe(ACTIVE_DOWNLOADS_URI)
-            assert mock_session in _subscribed_sessions
+        request_context_patch.set(mock_session)
 
-            await _on_download_event({"task_id": "test"})
-            mock_session.send_resource_updated.assert_called_once()
+        await handle_subscribe(ACTIVE_DOWNLOADS_URI, ctx=mock_context)
+        assert mock_session in _subscribed_sessions
+
+        await _on_download_event({"task_id": "test"})
+        mock_session.send_resource_updated.assert_called_once()
 
-            await handle_unsubscribe(ACTIVE_DOWNLOADS_URI)
-            assert mock_session not in _subscribed_sessions
+        await handle_unsubscribe(ACTIVE_DOWNLOADS_URI)
+        assert mock_session not in _subscribed_sessions
 
-            mock_session.send_resource_updated.reset_mock()
-            await _on_download_event({"task_id": "test"})
-            mock_session.send_resource_updated.assert_not_called()
+        mock_session.send_resource_updated.reset_mock()
+        await _on_download_event({"task_id": "test"})
+        mock_session.send_resource_updated.assert_not_called()
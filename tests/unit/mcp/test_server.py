@@ -9,21 +9,36 @@ from getit.registry import ExtractorRegistry
 from getit.service import DownloadService
 from getit.tasks import TaskRegistry
 
+# Registry contents left by the extractor imports, copied once at import time
+_EXTRACTORS_SNAPSHOT = dict(ExtractorRegistry._extractors)
+_DOMAIN_INDEX_SNAPSHOT = {
+    domain: list(extractors) for domain, extractors in ExtractorRegistry._domain_index.items()
+}
+_UNINDEXED_SNAPSHOT = list(ExtractorRegistry._unindexed)
+
 
 @pytest.fixture(autouse=True)
 def reset_mcp_state():
     import getit.mcp.server as server_module
 
-    original_context = server_module._context
-    original_extractors = ExtractorRegistry._extractors.copy()
-
-    server_module._context = None
+    token = server_module._context.set(None)
+    original_extractors = ExtractorRegistry._extractors
+    original_domain_index = ExtractorRegistry._domain_index
+    original_unindexed = ExtractorRegistry._unindexed
+    ExtractorRegistry._extractors = dict(_EXTRACTORS_SNAPSHOT)
+    ExtractorRegistry._domain_index = {
+        domain: list(extractors) for domain, extractors in _DOMAIN_INDEX_SNAPSHOT.items()
+    }
+    ExtractorRegistry._unindexed = list(_UNINDEXED_SNAPSHOT)
+    ExtractorRegistry.clear_lookup_cache()
 
     yield
 
-    server_module._context = original_context
-    ExtractorRegistry._extractors.clear()
-    ExtractorRegistry._extractors.update(original_extractors)
+    server_module._context.reset(token)
+    ExtractorRegistry._extractors = original_extractors
+    ExtractorRegistry._domain_index = original_domain_index
+    ExtractorRegistry._unindexed = original_unindexed
+    ExtractorRegistry.clear_lookup_cache()
 
 
 class TestCreateServer:
@@ -62,7 +77,7 @@ class TestGetContext:
     def test_raises_before_create(self) -> None:
         import getit.mcp.server as server_module
 
-        server_module._context = None
+        server_module._context.set(None)
         with pytest.raises(RuntimeError, match="not initialized"):
             get_context()
         create_server()
@@ -76,6 +91,16 @@ class TestServerContext:
         assert ctx.extractor_registry is ExtractorRegistry
         assert ctx.download_service is None
 
+    def test_registries_created_on_first_access(self) -> None:
+        ctx = ServerContext()
+        assert ctx._event_bus is None
+        assert ctx._task_registry is None
+        assert ctx.event_bus is ctx.event_bus
+        assert ctx.task_registry is ctx.task_registry
+
+    def test_uses_slots(self) -> None:
+        assert not hasattr(ServerContext(), "__dict__")
+
 
 class TestMCPInstance:
     def test_mcp_is_fastmcp(self) -> None:
@@ -94,23 +119,17 @@ class TestMCPInstance:
         assert callable(mcp.prompt)
 
 
-class TestExtractorRegistration:
-    def test_gofile_extractor_registered(self) -> None:
-        create_server()
-        assert ExtractorRegistry.get("gofile") is not None
-
-    def test_pixeldrain_extractor_registered(self) -> None:
-        create_server()
-        assert ExtractorRegistry.get("pixeldrain") is not None
+@pytest.fixture(scope="class")
+def server():
+    import getit.mcp.server as server_module
 
-    def test_mediafire_extractor_registered(self) -> None:
-        create_server()
-        assert ExtractorRegistry.get("mediafire") is not None
+    token = server_module._context.set(None)
+    create_server()
+    yield
+    server_module._context.reset(token)
 
-    def test_onefichier_extractor_registered(self) -> None:
-        create_server()
-        assert ExtractorRegistry.get("1fichier") is not None
 
-    def test_mega_extractor_registered(self) -> None:
-        create_server()
-        assert ExtractorRegistry.get("mega") is not None
+class TestExtractorRegistration:
+    @pytest.mark.parametrize("name", ["gofile", "pixeldrain", "mediafire", "1fichier", "mega"])
+    def test_extractor_registered(self, server, name: str) -> None:
+        assert ExtractorRegistry.get(name) is not None
@@ -1,31 +1,84 @@
 from __future__ import annotations
 
 import contextlib
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 
 from getit.extractors.base import FileInfo
-from getit.mcp.server import ServerContext
+from getit.mcp.server import ServerContext, mcp
 from getit.mcp.tools import cancel_download, download, get_download_status, list_files
-from getit.tasks import TaskInfo, TaskRegistry, TaskStatus
+from getit.tasks import TaskInfo, TaskStatus
+
+
+class _FakeTaskRegistry:
+    """Stands in for TaskRegistry with just the members the tools touch."""
+
+    def __init__(self) -> None:
+        self._db = MagicMock()
+        self.connect = AsyncMock()
+        self.get_task = AsyncMock()
+
+
+@pytest.fixture(scope="session")
+def _ctx_skeleton() -> ServerContext:
+    return ServerContext()
 
 
 @pytest.fixture
-def mock_context():
-    ctx = ServerContext()
+def mock_context(_ctx_skeleton):
+    # Keep the context object, swap in fresh mocks so no configured return
+    # value carries over from a previous test
+    ctx = _ctx_skeleton
     ctx.download_service = AsyncMock()
     ctx.download_service._manager = MagicMock()
-    ctx.task_registry = AsyncMock(spec=TaskRegistry)
-    ctx.task_registry._db = MagicMock()
+    ctx.task_registry = _FakeTaskRegistry()
     return ctx
 
 
-@pytest.fixture(autouse=True)
-def setup_context(mock_context):
-    with patch("getit.mcp.tools.get_context", return_value=mock_context):
-        yield mock_context
+@pytest.fixture(scope="module")
+def _base_file_info() -> FileInfo:
+    return FileInfo(
+        url="https://gofile.io/d/abc123",
+        filename="test.txt",
+        size=1024,
+        direct_url="https://direct.url",
+        password_protected=False,
+        checksum="abc123",
+        checksum_type="md5",
+        parent_folder="folder",
+        extractor_name="gofile",
+        encrypted=False,
+    )
+
+
+@pytest.fixture
+def file_info(_base_file_info: FileInfo) -> FileInfo:
+    # Hand each test its own copy so mutations cannot leak between tests
+    return replace(_base_file_info)
+
+
+_ENTRYPOINTS = [
+    pytest.param(download, "https://gofile.io/d/abc123", id="download"),
+    pytest.param(list_files, "https://gofile.io/d/abc123", id="list_files"),
+    pytest.param(cancel_download, "test-task-123", id="cancel_download"),
+]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def registered_tool_names() -> frozenset[str]:
+    return frozenset(t.name for t in await mcp.list_tools())
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup_context(_ctx_skeleton):
+    # mock_context refills this same object per test, so one patch serves the
+    # whole module. Module scope keeps it from leaking into other test files.
+    with patch("getit.mcp.tools.get_context", return_value=_ctx_skeleton):
+        yield _ctx_skeleton
 
 
 class TestDownload:
@@ -65,49 +118,10 @@ class TestDownload:
         call_args = mock_context.download_service.download.call_args
         assert call_args[0][2] == "secret"
 
-    @pytest.mark.asyncio
-    async def test_connects_task_registry_if_needed(self, mock_context):
-        mock_context.task_registry._db = None
-        mock_context.task_registry.connect = AsyncMock()
-        mock_context.download_service.download.return_value = "task-id"
-
-        await download("https://gofile.io/d/abc123")
-
-        mock_context.task_registry.connect.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_starts_download_service_if_needed(self, mock_context):
-        mock_context.download_service._manager = None
-        mock_context.download_service.start = AsyncMock()
-        mock_context.download_service.download.return_value = "task-id"
-
-        await download("https://gofile.io/d/abc123")
-
-        mock_context.download_service.start.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_raises_if_download_service_not_initialized(self, mock_context):
-        mock_context.download_service = None
-
-        with pytest.raises(RuntimeError, match="DownloadService not initialized"):
-            await download("https://gofile.io/d/abc123")
-
 
 class TestListFiles:
     @pytest.mark.asyncio
-    async def test_returns_file_list(self, mock_context):
-        file_info = FileInfo(
-            url="https://gofile.io/d/abc123",
-            filename="test.txt",
-            size=1024,
-            direct_url="https://direct.url",
-            password_protected=False,
-            checksum="abc123",
-            checksum_type="md5",
-            parent_folder="folder",
-            extractor_name="gofile",
-            encrypted=False,
-        )
+    async def test_returns_file_list(self, mock_context, file_info):
         mock_context.download_service.list_files.return_value = [file_info]
 
         result = await list_files("https://gofile.io/d/abc123")
@@ -118,12 +132,10 @@ class TestListFiles:
         assert result["files"][0]["size"] == 1024
 
     @pytest.mark.asyncio
-    async def test_converts_all_file_info_fields(self, mock_context):
-        file_info = FileInfo(
-            url="https://gofile.io/d/abc123",
-            filename="test.txt",
+    async def test_converts_all_file_info_fields(self, mock_context, file_info):
+        file_info = replace(
+            file_info,
             size=2048,
-            direct_url="https://direct.url",
             password_protected=True,
             checksum="def456",
             checksum_type="sha256",
@@ -165,33 +177,6 @@ class TestListFiles:
 
         assert result == {"files": []}
 
-    @pytest.mark.asyncio
-    async def test_connects_task_registry_if_needed(self, mock_context):
-        mock_context.task_registry._db = None
-        mock_context.task_registry.connect = AsyncMock()
-        mock_context.download_service.list_files.return_value = []
-
-        await list_files("https://gofile.io/d/abc123")
-
-        mock_context.task_registry.connect.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_starts_download_service_if_needed(self, mock_context):
-        mock_context.download_service._manager = None
-        mock_context.download_service.start = AsyncMock()
-        mock_context.download_service.list_files.return_value = []
-
-        await list_files("https://gofile.io/d/abc123")
-
-        mock_context.download_service.start.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_raises_if_download_service_not_initialized(self, mock_context):
-        mock_context.download_service = None
-
-        with pytest.raises(RuntimeError, match="DownloadService not initialized"):
-            await list_files("https://gofile.io/d/abc123")
-
 
 class TestGetDownloadStatus:
     @pytest.mark.asyncio
@@ -252,17 +237,6 @@ class TestGetDownloadStatus:
         with pytest.raises(ValueError, match="Task test-task-123 not found"):
             await get_download_status("test-task-123")
 
-    @pytest.mark.asyncio
-    async def test_connects_task_registry_if_needed(self, mock_context):
-        mock_context.task_registry._db = None
-        mock_context.task_registry.connect = AsyncMock()
-        mock_context.task_registry.get_task.return_value = None
-
-        with contextlib.suppress(ValueError):
-            await get_download_status("test-task-123")
-
-        mock_context.task_registry.connect.assert_called_once()
-
 
 class TestCancelDownload:
     @pytest.mark.asyncio
@@ -289,59 +263,44 @@ class TestCancelDownload:
 
         mock_context.download_service.cancel.assert_called_once_with("test-task-123")
 
+
+class TestEnsureServicesReady:
+    @pytest.mark.parametrize(
+        ("tool", "arg"),
+        [*_ENTRYPOINTS, pytest.param(get_download_status, "test-task-123", id="status")],
+    )
     @pytest.mark.asyncio
-    async def test_connects_task_registry_if_needed(self, mock_context):
+    async def test_connects_task_registry_if_needed(self, mock_context, tool, arg):
         mock_context.task_registry._db = None
-        mock_context.task_registry.connect = AsyncMock()
-        mock_context.download_service.cancel.return_value = True
+        mock_context.task_registry.get_task.return_value = None
 
-        await cancel_download("test-task-123")
+        with contextlib.suppress(ValueError):
+            await tool(arg)
 
         mock_context.task_registry.connect.assert_called_once()
 
+    @pytest.mark.parametrize(("tool", "arg"), _ENTRYPOINTS)
     @pytest.mark.asyncio
-    async def test_starts_download_service_if_needed(self, mock_context):
+    async def test_starts_download_service_if_needed(self, mock_context, tool, arg):
         mock_context.download_service._manager = None
-        mock_context.download_service.start = AsyncMock()
-        mock_context.download_service.cancel.return_value = True
 
-        await cancel_download("test-task-123")
+        await tool(arg)
 
         mock_context.download_service.start.assert_called_once()
 
+    @pytest.mark.parametrize(("tool", "arg"), _ENTRYPOINTS)
     @pytest.mark.asyncio
-    async def test_raises_if_download_service_not_initialized(self, mock_context):
+    async def test_raises_if_download_service_not_initialized(self, mock_context, tool, arg):
         mock_context.download_service = None
 
         with pytest.raises(RuntimeError, match="DownloadService not initialized"):
-            await cancel_download("test-task-123")
+            await tool(arg)
 
 
+@pytest.mark.mcp_registration
 class TestMCPRegistration:
-    @pytest.mark.asyncio
-    async def test_download_tool_registered(self):
-        from getit.mcp.server import mcp
-
-        tools = [t.name for t in await mcp.list_tools()]
-        assert "download" in tools
-
-    @pytest.mark.asyncio
-    async def test_list_files_tool_registered(self):
-        from getit.mcp.server import mcp
-
-        tools = [t.name for t in await mcp.list_tools()]
-        assert "list_files" in tools
-
-    @pytest.mark.asyncio
-    async def test_get_download_status_tool_registered(self):
-        from getit.mcp.server import mcp
-
-        tools = [t.name for t in await mcp.list_tools()]
-        assert "get_download_status" in tools
-
-    @pytest.mark.asyncio
-    async def test_cancel_download_tool_registered(self):
-        from getit.mcp.server import mcp
-
-        tools = [t.name for t in await mcp.list_tools()]
-        assert "cancel_download" in tools
+    @pytest.mark.parametrize(
+        "name", ["download", "list_files", "get_download_status", "cancel_download"]
+    )
+    def test_tool_registered(self, registered_tool_names, name):
+        assert name in registered_tool_names
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, mock_open, patch
 
 import pytest
 
@@ -18,6 +20,19 @@ from getit.config import (
     update_settings,
 )
 
+_CONFIG_JSON_BASIC = json.dumps({"max_concurrent_downloads": 5, "enable_resume": False})
+_CONFIG_JSON_DOWNLOAD_DIR = json.dumps({"download_dir": "~/Downloads/test"})
+
+
+@contextmanager
+def _config_file(contents: str) -> Iterator[None]:
+    """Serve ``contents`` as the config file without touching the disk."""
+    config_path = Mock(spec=Path)
+    config_path.exists.return_value = True
+    config_path.open = mock_open(read_data=contents)
+    with patch("getit.config.get_config_file_path", return_value=config_path):
+        yield
+
 
 class TestGetDefaultConfigDir:
     """Tests for get_default_config_dir()."""
@@ -27,28 +42,32 @@ class TestGetDefaultConfigDir:
         result = get_default_config_dir()
         assert isinstance(result, Path)
 
-    def test_creates_directory(self, temp_dir: Path) -> None:
+    def test_creates_directory(self, tmp_path: Path) -> None:
         """Should create the directory if it doesn't exist."""
         with (
-            patch("getit.config.Path.home", return_value=temp_dir),
+            patch("getit.config.Path.home", return_value=tmp_path),
             patch("sys.platform", "linux"),
         ):
             result = get_default_config_dir()
             assert result.exists()
 
     @patch("sys.platform", "darwin")
-    def test_macos_path(self, temp_dir: Path) -> None:
+    def test_macos_path(self) -> None:
         """Should use ~/Library/Application Support on macOS."""
-        with patch("getit.config.Path.home", return_value=temp_dir):
+        with (
+            patch("getit.config.Path.home", return_value=Path("/fakehome")),
+            patch.object(Path, "mkdir"),
+        ):
             result = get_default_config_dir()
             assert "Library/Application Support/getit" in str(result)
 
     @patch("sys.platform", "linux")
-    def test_linux_path(self, temp_dir: Path) -> None:
+    def test_linux_path(self) -> None:
         """Should use ~/.config on Linux."""
         with (
-            patch("getit.config.Path.home", return_value=temp_dir),
+            patch("getit.config.Path.home", return_value=Path("/fakehome")),
             patch.dict("os.environ", {"XDG_CONFIG_HOME": ""}, clear=False),
+            patch.object(Path, "mkdir"),
         ):
             result = get_default_config_dir()
             assert ".config/getit" in str(result) or "getit" in str(result)
@@ -62,9 +81,9 @@ class TestGetDefaultDownloadDir:
         result = get_default_download_dir()
         assert isinstance(result, Path)
 
-    def test_creates_directory(self, temp_dir: Path) -> None:
+    def test_creates_directory(self, tmp_path: Path) -> None:
         """Should create the directory if it doesn't exist."""
-        with patch("getit.config.Path.home", return_value=temp_dir):
+        with patch("getit.config.Path.home", return_value=tmp_path):
             result = get_default_download_dir()
             assert result.exists()
             assert result.name == "getit"
@@ -73,41 +92,28 @@ class TestGetDefaultDownloadDir:
 class TestLoadConfig:
     """Tests for load_config()."""
 
-    def test_returns_empty_dict_if_no_file(self, temp_config_dir: Path) -> None:
+    def test_returns_empty_dict_if_no_file(self, tmp_path: Path) -> None:
         """Should return empty dict if config file doesn't exist."""
-        with patch(
-            "getit.config.get_config_file_path", return_value=temp_config_dir / "config.json"
-        ):
+        with patch("getit.config.get_config_file_path", return_value=tmp_path / "config.json"):
             result = load_config()
             assert result == {}
 
-    def test_loads_valid_json(self, temp_config_dir: Path) -> None:
+    def test_loads_valid_json(self) -> None:
         """Should load valid JSON config."""
-        config_path = temp_config_dir / "config.json"
-        config_data = {"max_concurrent_downloads": 5, "enable_resume": False}
-        config_path.write_text(json.dumps(config_data))
-
-        with patch("getit.config.get_config_file_path", return_value=config_path):
+        with _config_file(_CONFIG_JSON_BASIC):
             result = load_config()
             assert result["max_concurrent_downloads"] == 5
             assert result["enable_resume"] is False
 
-    def test_converts_download_dir_to_path(self, temp_config_dir: Path) -> None:
+    def test_converts_download_dir_to_path(self) -> None:
         """Should convert download_dir string to Path."""
-        config_path = temp_config_dir / "config.json"
-        config_data = {"download_dir": "~/Downloads/test"}
-        config_path.write_text(json.dumps(config_data))
-
-        with patch("getit.config.get_config_file_path", return_value=config_path):
+        with _config_file(_CONFIG_JSON_DOWNLOAD_DIR):
             result = load_config()
             assert isinstance(result["download_dir"], Path)
 
-    def test_returns_empty_dict_on_invalid_json(self, temp_config_dir: Path) -> None:
+    def test_returns_empty_dict_on_invalid_json(self) -> None:
         """Should return empty dict on invalid JSON."""
-        config_path = temp_config_dir / "config.json"
-        config_path.write_text("not valid json {{{")
-
-        with patch("getit.config.get_config_file_path", return_value=config_path):
+        with _config_file("not valid json {{{"):
             result = load_config()
             assert result == {}
 
@@ -115,12 +121,12 @@ class TestLoadConfig:
 class TestSaveConfig:
     """Tests for save_config()."""
 
-    def test_saves_config_to_file(self, temp_config_dir: Path, temp_download_dir: Path) -> None:
+    def test_saves_config_to_file(self, tmp_path: Path) -> None:
         """Should save settings to JSON file."""
-        config_path = temp_config_dir / "config.json"
+        config_path = tmp_path / "config.json"
         settings = Settings(
-            download_dir=temp_download_dir,
-            config_dir=temp_config_dir,
+            download_dir=tmp_path / "downloads",
+            config_dir=tmp_path,
             max_concurrent_downloads=5,
             enable_resume=False,
         )
@@ -133,12 +139,12 @@ class TestSaveConfig:
         assert data["max_concurrent_downloads"] == 5
         assert data["enable_resume"] is False
 
-    def test_creates_parent_directory(self, temp_dir: Path, temp_download_dir: Path) -> None:
+    def test_creates_parent_directory(self, tmp_path: Path) -> None:
         """Should create parent directory if it doesn't exist."""
-        config_path = temp_dir / "nested" / "config" / "config.json"
+        config_path = tmp_path / "nested" / "config" / "config.json"
         settings = Settings(
-            download_dir=temp_download_dir,
-            config_dir=temp_dir,
+            download_dir=tmp_path / "downloads",
+            config_dir=tmp_path,
         )
 
         with patch("getit.config.get_config_file_path", return_value=config_path):
@@ -147,83 +153,85 @@ class TestSaveConfig:
         assert config_path.exists()
 
 
+@pytest.fixture(scope="session")
+def _default_settings() -> Settings:
+    """Default Settings shared by read-only tests; do not mutate."""
+    return Settings()
+
+
 class TestSettings:
     """Tests for Settings class."""
 
-    def test_default_values(self) -> None:
+    def test_default_values(self, _default_settings: Settings) -> None:
         """Should have sensible default values."""
-        settings = Settings()
-        assert settings.max_concurrent_downloads == 3
-        assert settings.max_retries == 3
-        assert settings.enable_resume is True
-        assert settings.theme == "dark"
+        assert _default_settings.max_concurrent_downloads == 3
+        assert _default_settings.max_retries == 3
+        assert _default_settings.enable_resume is True
+        assert _default_settings.theme == "dark"
 
-    def test_custom_values(self, temp_download_dir: Path) -> None:
+    def test_custom_values(self, tmp_path: Path) -> None:
         """Should accept custom values."""
+        download_dir = tmp_path / "downloads"
         settings = Settings(
-            download_dir=temp_download_dir,
+            download_dir=download_dir,
             max_concurrent_downloads=5,
             max_retries=1,
             enable_resume=False,
         )
-        assert settings.download_dir == temp_download_dir
+        assert settings.download_dir == download_dir
         assert settings.max_concurrent_downloads == 5
         assert settings.max_retries == 1
         assert settings.enable_resume is False
 
-    def test_validation_min_values(self) -> None:
-        """Should validate minimum values."""
-        with pytest.raises(ValueError):
-            Settings(max_concurrent_downloads=0)
-
-    def test_validation_max_values(self) -> None:
-        """Should validate maximum values."""
+    @pytest.mark.parametrize("value", [0, 100])
+    def test_validation_rejects_out_of_range(self, value: int) -> None:
+        """Should reject values outside the allowed range."""
         with pytest.raises(ValueError):
-            Settings(max_concurrent_downloads=100)
+            Settings(max_concurrent_downloads=value)
 
-    def test_history_db_default(self, temp_config_dir: Path) -> None:
+    def test_history_db_default(self, tmp_path: Path) -> None:
         """Should set history_db from config_dir."""
-        settings = Settings(config_dir=temp_config_dir)
-        assert settings.history_db == temp_config_dir / "history.db"
+        settings = Settings(config_dir=tmp_path)
+        assert settings.history_db == tmp_path / "history.db"
+
+
+@pytest.fixture
+def reset_global_settings() -> Iterator[None]:
+    """Clear the cached global settings before and after the test."""
+    import getit.config
+
+    getit.config._settings = None
+    yield
+    getit.config._settings = None
 
 
+@pytest.mark.usefixtures("reset_global_settings")
 class TestGetSettings:
     """Tests for get_settings()."""
 
     def test_returns_settings_instance(self) -> None:
         """Should return a Settings instance."""
-        # Reset global state
-        import getit.config
-
-        getit.config._settings = None
-
         result = get_settings()
         assert isinstance(result, Settings)
 
     def test_caches_instance(self) -> None:
         """Should return the same instance on subsequent calls."""
-        import getit.config
-
-        getit.config._settings = None
-
         result1 = get_settings()
         result2 = get_settings()
         assert result1 is result2
 
 
+@pytest.mark.usefixtures("reset_global_settings")
 class TestUpdateSettings:
     """Tests for update_settings()."""
 
-    def test_updates_global_settings(self, temp_download_dir: Path) -> None:
+    def test_updates_global_settings(self, tmp_path: Path) -> None:
         """Should update the global settings instance."""
-        import getit.config
-
-        getit.config._settings = None
-
+        download_dir = tmp_path / "downloads"
         result = update_settings(
-            download_dir=temp_download_dir,
+            download_dir=download_dir,
             max_concurrent_downloads=7,
         )
 
-        assert result.download_dir == temp_download_dir
+        assert result.download_dir == download_dir
         assert result.max_concurrent_downloads == 7
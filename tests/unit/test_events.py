@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import gc
+import inspect
+import sys
+import tracemalloc
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
 
+import getit.events as events_module
 from getit.events import (
     DOWNLOAD_COMPLETE,
     DOWNLOAD_ERROR,
@@ -15,35 +21,74 @@ from getit.events import (
 )
 
 
+class _Spy:
+    """Records the data of each call; far cheaper to call than a Mock."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls: list[Any] = []
+
+    def __call__(self, data: Any) -> None:
+        self.calls.append(data)
+
+
+class _Listener:
+    """Owner of a bound-method subscriber."""
+
+    def __init__(self) -> None:
+        self.calls: list[Any] = []
+
+    def on_event(self, data: Any) -> None:
+        self.calls.append(data)
+
+
 class TestEventBusSubscribe:
     """Tests for EventBus.subscribe()."""
 
+    def test_subscriber_count_unknown_event(self) -> None:
+        """Should report zero subscribers for an event nobody subscribed to."""
+        assert EventBus().subscriber_count("nonexistent_event") == 0
+
+    def test_uses_slots(self) -> None:
+        """EventBus instances should not carry a per-instance __dict__."""
+        assert not hasattr(EventBus(), "__dict__")
+
     def test_subscribe_callback(self) -> None:
         """Should allow subscribing a callback to an event."""
         bus = EventBus()
-        callback = Mock()
+        callback = _Spy()
         bus.subscribe(DOWNLOAD_PROGRESS, callback)
-        assert len(bus._subscribers[DOWNLOAD_PROGRESS]) == 1
-        assert bus._subscribers[DOWNLOAD_PROGRESS][0] == callback
+        assert bus.subscriber_count(DOWNLOAD_PROGRESS) == 1
+        assert list(bus._subscribers[DOWNLOAD_PROGRESS]) == [callback]
 
     def test_subscribe_multiple_callbacks(self) -> None:
         """Should allow multiple callbacks for the same event."""
         bus = EventBus()
-        callback1 = Mock()
-        callback2 = Mock()
+        callback1 = _Spy()
+        callback2 = _Spy()
         bus.subscribe(DOWNLOAD_PROGRESS, callback1)
         bus.subscribe(DOWNLOAD_PROGRESS, callback2)
-        assert len(bus._subscribers[DOWNLOAD_PROGRESS]) == 2
+        assert bus.subscriber_count(DOWNLOAD_PROGRESS) == 2
 
     def test_subscribe_different_events(self) -> None:
         """Should maintain separate subscriber lists for different events."""
         bus = EventBus()
-        callback1 = Mock()
-        callback2 = Mock()
+        callback1 = _Spy()
+        callback2 = _Spy()
         bus.subscribe(DOWNLOAD_PROGRESS, callback1)
         bus.subscribe(DOWNLOAD_COMPLETE, callback2)
-        assert len(bus._subscribers[DOWNLOAD_PROGRESS]) == 1
-        assert len(bus._subscribers[DOWNLOAD_COMPLETE]) == 1
+        assert bus.subscriber_count(DOWNLOAD_PROGRESS) == 1
+        assert bus.subscriber_count(DOWNLOAD_COMPLETE) == 1
+
+    def test_subscribe_many(self) -> None:
+        """Should subscribe one callback to each of the given events."""
+        bus = EventBus()
+        callback = _Spy()
+        bus.subscribe_many((DOWNLOAD_PROGRESS, DOWNLOAD_COMPLETE, DOWNLOAD_ERROR), callback)
+        assert list(bus._subscribers[DOWNLOAD_PROGRESS]) == [callback]
+        assert list(bus._subscribers[DOWNLOAD_COMPLETE]) == [callback]
+        assert list(bus._subscribers[DOWNLOAD_ERROR]) == [callback]
 
 
 class TestEventBusUnsubscribe:
@@ -52,69 +97,163 @@ class TestEventBusUnsubscribe:
     def test_unsubscribe_callback(self) -> None:
         """Should remove a callback from an event."""
         bus = EventBus()
-        callback = Mock()
+        callback = _Spy()
         bus.subscribe(DOWNLOAD_PROGRESS, callback)
         bus.unsubscribe(DOWNLOAD_PROGRESS, callback)
-        assert len(bus._subscribers[DOWNLOAD_PROGRESS]) == 0
+        assert bus.subscriber_count(DOWNLOAD_PROGRESS) == 0
 
     def test_unsubscribe_specific_callback(self) -> None:
         """Should only remove the specified callback."""
         bus = EventBus()
-        callback1 = Mock()
-        callback2 = Mock()
+        callback1 = _Spy()
+        callback2 = _Spy()
         bus.subscribe(DOWNLOAD_PROGRESS, callback1)
         bus.subscribe(DOWNLOAD_PROGRESS, callback2)
         bus.unsubscribe(DOWNLOAD_PROGRESS, callback1)
-        assert len(bus._subscribers[DOWNLOAD_PROGRESS]) == 1
-        assert bus._subscribers[DOWNLOAD_PROGRESS][0] == callback2
+        assert bus.subscriber_count(DOWNLOAD_PROGRESS) == 1
+        assert list(bus._subscribers[DOWNLOAD_PROGRESS]) == [callback2]
 
     def test_unsubscribe_nonexistent_callback(self) -> None:
         """Should not raise when unsubscribing nonexistent callback."""
         bus = EventBus()
-        callback = Mock()
+        callback = _Spy()
         bus.unsubscribe(DOWNLOAD_PROGRESS, callback)
         # Should not raise
 
     def test_unsubscribe_nonexistent_event(self) -> None:
         """Should not raise when unsubscribing from nonexistent event."""
         bus = EventBus()
-        callback = Mock()
+        callback = _Spy()
         bus.unsubscribe("nonexistent_event", callback)
         # Should not raise
 
 
+class TestEventBusBoundMethods:
+    """Tests for bound-method subscribers, which are held weakly."""
+
+    def test_bound_method_receives_events(self) -> None:
+        """Should deliver events to a bound method while its owner is alive."""
+        bus = EventBus()
+        listener = _Listener()
+        bus.subscribe(DOWNLOAD_PROGRESS, listener.on_event)
+        bus.subscribe(DOWNLOAD_PROGRESS, listener.on_event)
+        bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
+        assert listener.calls == [{"progress": 50}]
+
+    def test_unsubscribe_bound_method(self) -> None:
+        """Should unsubscribe a bound method via a fresh bound-method object."""
+        bus = EventBus()
+        listener = _Listener()
+        bus.subscribe(DOWNLOAD_PROGRESS, listener.on_event)
+        bus.unsubscribe(DOWNLOAD_PROGRESS, listener.on_event)
+        bus.emit(DOWNLOAD_PROGRESS, None)
+        assert listener.calls == []
+        assert bus.subscriber_count(DOWNLOAD_PROGRESS) == 0
+
+    def test_subscription_dropped_when_owner_collected(self) -> None:
+        """Should not keep the owner alive and should drop its subscription."""
+        bus = EventBus()
+        listener = _Listener()
+        bus.subscribe(DOWNLOAD_PROGRESS, listener.on_event)
+
+        del listener
+        gc.collect()
+
+        assert bus.subscriber_count(DOWNLOAD_PROGRESS) == 0
+        assert DOWNLOAD_PROGRESS not in bus._dispatch
+        bus.emit(DOWNLOAD_PROGRESS, None)
+
+    def test_collection_during_refresh_is_deferred(self) -> None:
+        """Should not change the subscriber dict while a refresh iterates it."""
+        bus = EventBus()
+        kept, dropped = _Listener(), _Listener()
+        dropped.cycle = dropped  # type: ignore[attr-defined]  # only gc frees it
+        bus.subscribe(DOWNLOAD_PROGRESS, kept.on_event)
+        bus.subscribe(DOWNLOAD_PROGRESS, dropped.on_event)
+        del dropped
+
+        collected = False
+        iscoroutinefunction = inspect.iscoroutinefunction
+
+        def collect_then_check(obj: Any) -> bool:
+            nonlocal collected
+            if not collected:
+                collected = True
+                gc.collect()
+            return iscoroutinefunction(obj)
+
+        gc.disable()
+        try:
+            with patch.object(events_module.inspect, "iscoroutinefunction", collect_then_check):
+                bus.subscribe(DOWNLOAD_PROGRESS, _Spy())
+        finally:
+            gc.enable()
+
+        assert collected
+        assert bus.subscriber_count(DOWNLOAD_PROGRESS) == 2
+        bus.emit(DOWNLOAD_PROGRESS, 1)
+        assert kept.calls == [1]
+
+    def test_bound_method_of_unhashable_owner_held_strongly(self) -> None:
+        """Should fall back to a strong reference when the owner is unhashable."""
+
+        class Unhashable(_Listener):
+            __hash__ = None  # type: ignore[assignment]
+
+        bus = EventBus()
+        bus.subscribe(DOWNLOAD_PROGRESS, Unhashable().on_event)
+        gc.collect()
+
+        assert bus.subscriber_count(DOWNLOAD_PROGRESS) == 1
+
+
 class TestEventBusEmit:
     """Tests for EventBus.emit()."""
 
     def test_emit_calls_callback(self) -> None:
         """Should call registered callbacks when event is emitted."""
         bus = EventBus()
-        callback = Mock()
+        callback = _Spy()
         bus.subscribe(DOWNLOAD_PROGRESS, callback)
         bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
-        callback.assert_called_once_with({"progress": 50})
+        assert callback.calls == [{"progress": 50}]
 
     def test_emit_calls_multiple_callbacks(self) -> None:
         """Should call all registered callbacks."""
         bus = EventBus()
-        callback1 = Mock()
-        callback2 = Mock()
+        callback1 = _Spy()
+        callback2 = _Spy()
         bus.subscribe(DOWNLOAD_PROGRESS, callback1)
         bus.subscribe(DOWNLOAD_PROGRESS, callback2)
         bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
-        callback1.assert_called_once_with({"progress": 50})
-        callback2.assert_called_once_with({"progress": 50})
+        assert callback1.calls == [{"progress": 50}]
+        assert callback2.calls == [{"progress": 50}]
 
     def test_emit_different_events_independently(self) -> None:
         """Should only call callbacks for the emitted event."""
         bus = EventBus()
-        progress_callback = Mock()
-        complete_callback = Mock()
+        progress_callback = _Spy()
+        complete_callback = _Spy()
         bus.subscribe(DOWNLOAD_PROGRESS, progress_callback)
         bus.subscribe(DOWNLOAD_COMPLETE, complete_callback)
         bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
-        progress_callback.assert_called_once()
-        complete_callback.assert_not_called()
+        assert len(progress_callback.calls) == 1
+        assert complete_callback.calls == []
+
+    def test_emit_tolerates_unsubscribe_during_dispatch(self) -> None:
+        """Should still call every subscriber when one unsubscribes itself."""
+        bus = EventBus()
+        callback2 = _Spy()
+
+        def one_shot(data: dict | None) -> None:
+            bus.unsubscribe(DOWNLOAD_PROGRESS, one_shot)
+
+        bus.subscribe(DOWNLOAD_PROGRESS, one_shot)
+        bus.subscribe(DOWNLOAD_PROGRESS, callback2)
+        bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
+
+        assert callback2.calls == [{"progress": 50}]
+        assert list(bus._subscribers[DOWNLOAD_PROGRESS]) == [callback2]
 
     def test_emit_no_callbacks(self) -> None:
         """Should not raise when emitting event with no callbacks."""
@@ -122,22 +261,41 @@ class TestEventBusEmit:
         bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
         # Should not raise
 
+    def test_emit_no_callbacks_does_not_allocate(self) -> None:
+        """Should return before allocating anything when nobody is subscribed."""
+        bus = EventBus()
+        callback = _Spy()
+        bus.subscribe(DOWNLOAD_COMPLETE, callback)
+        bus.unsubscribe(DOWNLOAD_COMPLETE, callback)
+        data = {"progress": 50}
+
+        tracemalloc.start()
+        try:
+            bus.emit(DOWNLOAD_PROGRESS, data)
+            bus.emit(DOWNLOAD_COMPLETE, data)
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        events_file = tracemalloc.Filter(True, events_module.__file__)
+        assert len(snapshot.filter_traces([events_file]).traces) == 0
+
     def test_emit_with_dict_data(self) -> None:
         """Should pass dict data to callbacks."""
         bus = EventBus()
-        callback = Mock()
+        callback = _Spy()
         bus.subscribe(DOWNLOAD_PROGRESS, callback)
         data = {"progress": 75, "speed": "2MB/s"}
         bus.emit(DOWNLOAD_PROGRESS, data)
-        callback.assert_called_once_with(data)
+        assert callback.calls == [data]
 
     def test_emit_with_none_data(self) -> None:
         """Should handle None data."""
         bus = EventBus()
-        callback = Mock()
+        callback = _Spy()
         bus.subscribe(DOWNLOAD_COMPLETE, callback)
         bus.emit(DOWNLOAD_COMPLETE, None)
-        callback.assert_called_once_with(None)
+        assert callback.calls == [None]
 
 
 class TestEventBusCallbackExceptions:
@@ -156,11 +314,24 @@ class TestEventBusCallbackExceptions:
             bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
             mock_logger.exception.assert_called_once()
 
+    def test_exception_message_formatted_lazily(self) -> None:
+        """Should pass the event name as a logging argument, not pre-formatted."""
+        bus = EventBus()
+        bus.subscribe(DOWNLOAD_PROGRESS, Mock(side_effect=ValueError("Test error")))
+
+        with patch("getit.events.logger") as mock_logger:
+            bus.emit(DOWNLOAD_PROGRESS, None)
+
+        assert mock_logger.exception.call_args.args == (
+            "Exception in callback for event %s",
+            DOWNLOAD_PROGRESS,
+        )
+
     def test_exception_in_callback_continues(self) -> None:
         """Should continue calling remaining callbacks after one fails."""
         bus = EventBus()
         callback1 = Mock(side_effect=ValueError("Test error"))
-        callback2 = Mock()
+        callback2 = _Spy()
 
         bus.subscribe(DOWNLOAD_PROGRESS, callback1)
         bus.subscribe(DOWNLOAD_PROGRESS, callback2)
@@ -168,9 +339,9 @@ class TestEventBusCallbackExceptions:
         with patch("getit.events.logger"):
             bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
 
-        callback2.assert_called_once()
+        assert len(callback2.calls) == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_exception_in_async_callback_logged(self) -> None:
         """Should log exception when async callback raises."""
         bus = EventBus()
@@ -189,7 +360,7 @@ class TestEventBusCallbackExceptions:
 class TestEventBusAsyncCallbacks:
     """Tests for async callback support."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_async_callback_executed(self) -> None:
         """Should execute async callbacks."""
         bus = EventBus()
@@ -207,11 +378,11 @@ class TestEventBusAsyncCallbacks:
         await asyncio.sleep(0.05)
         assert callback_executed
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_sync_and_async_callbacks_together(self) -> None:
         """Should execute both sync and async callbacks."""
         bus = EventBus()
-        sync_callback = Mock()
+        sync_callback = _Spy()
 
         async def async_callback(data: dict | None) -> None:
             await asyncio.sleep(0.01)
@@ -220,11 +391,148 @@ class TestEventBusAsyncCallbacks:
         bus.subscribe(DOWNLOAD_PROGRESS, async_callback)
         bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
 
-        sync_callback.assert_called_once()
+        assert len(sync_callback.calls) == 1
         # Give time for async task
         await asyncio.sleep(0.05)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_burst_of_emits_starts_one_batch(self) -> None:
+        """Should start the async deliveries of a burst of emits as one batch."""
+        bus = EventBus()
+        received: list[int] = []
+
+        async def async_callback(data: int) -> None:
+            received.append(data)
+
+        bus.subscribe(DOWNLOAD_PROGRESS, async_callback)
+        bus.emit(DOWNLOAD_PROGRESS, 1)
+        bus.emit(DOWNLOAD_PROGRESS, 2)
+        bus.emit(DOWNLOAD_PROGRESS, 3)
+        assert received == []
+
+        await asyncio.sleep(0)
+        assert len(bus._in_flight) == 1
+        await next(iter(bus._in_flight))
+        assert received == [1, 2, 3]
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_slow_callback_does_not_delay_others(self) -> None:
+        """Should not hold back other subscribers or later events behind a slow one."""
+        bus = EventBus()
+        release = asyncio.Event()
+        received: list[int] = []
+
+        async def slow_callback(data: int) -> None:
+            await release.wait()
+
+        async def fast_callback(data: int) -> None:
+            received.append(data)
+
+        bus.subscribe(DOWNLOAD_PROGRESS, slow_callback)
+        bus.subscribe(DOWNLOAD_PROGRESS, fast_callback)
+
+        bus.emit(DOWNLOAD_PROGRESS, 1)
+        await asyncio.sleep(0.01)
+        assert received == [1]
+
+        bus.emit(DOWNLOAD_PROGRESS, 2)
+        await asyncio.sleep(0.01)
+        assert received == [1, 2]
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert not bus._in_flight
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_emit_does_not_inspect_callbacks(self) -> None:
+        """Should classify callbacks at subscribe time, not on every emit."""
+        bus = EventBus()
+        sync_callback = _Spy()
+
+        async def async_callback(data: dict | None) -> None:
+            pass
+
+        bus.subscribe(DOWNLOAD_PROGRESS, sync_callback)
+        bus.subscribe(DOWNLOAD_PROGRESS, async_callback)
+
+        with patch(
+            "getit.events.inspect.iscoroutinefunction", wraps=inspect.iscoroutinefunction
+        ) as mock_check:
+            bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
+
+        # unittest.mock calls iscoroutinefunction internally, so only look for ours
+        inspected = [c.args[0] for c in mock_check.call_args_list]
+        assert sync_callback not in inspected
+        assert async_callback not in inspected
+
+        assert sync_callback.calls == [{"progress": 50}]
+        await asyncio.sleep(0)
+
+    def test_emits_on_successive_loops(self) -> None:
+        """Should deliver on each loop when the bus outlives asyncio.run."""
+        bus = EventBus()
+        received: list[int] = []
+
+        async def async_callback(data: int) -> None:
+            received.append(data)
+
+        async def emit_and_wait(data: int) -> None:
+            bus.emit(DOWNLOAD_PROGRESS, data)
+            await asyncio.sleep(0.01)
+
+        bus.subscribe(DOWNLOAD_PROGRESS, async_callback)
+        asyncio.run(emit_and_wait(1))
+        asyncio.run(emit_and_wait(2))
+
+        assert received == [1, 2]
+
+    def test_drops_deliveries_queued_on_a_stopped_loop(self) -> None:
+        """Should not run, on a new loop, callbacks queued for a stopped one."""
+        bus = EventBus()
+        received: list[str] = []
+
+        async def async_callback(data: str) -> None:
+            received.append(data)
+
+        async def stop_then_emit() -> None:
+            # The loop stops after this step, before the drain can run
+            asyncio.get_running_loop().stop()
+            bus.emit(DOWNLOAD_PROGRESS, "stale")
+
+        async def emit_and_wait(data: str) -> None:
+            bus.emit(DOWNLOAD_PROGRESS, data)
+            await asyncio.sleep(0.01)
+
+        bus.subscribe(DOWNLOAD_PROGRESS, async_callback)
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(stop_then_emit())
+        finally:
+            loop.close()
+        with patch("getit.events.logger") as mock_logger:
+            asyncio.run(emit_and_wait("fresh"))
+            mock_logger.warning.assert_called_once()
+
+        assert received == ["fresh"]
+
+    def test_async_callbacks_skipped_without_running_loop(self) -> None:
+        """Should still call sync callbacks when async ones cannot be scheduled."""
+        bus = EventBus()
+        sync_callback = _Spy()
+
+        async def async_callback(data: dict | None) -> None:
+            raise AssertionError("should not run")
+
+        bus.subscribe(DOWNLOAD_PROGRESS, async_callback)
+        bus.subscribe(DOWNLOAD_PROGRESS, sync_callback)
+
+        with patch("getit.events.logger") as mock_logger:
+            bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
+            mock_logger.warning.assert_called_once()
+
+        assert sync_callback.calls == [{"progress": 50}]
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_emit_returns_immediately_for_async(self) -> None:
         """Should return immediately when emitting (async runs in background)."""
         bus = EventBus()
@@ -253,6 +561,12 @@ class TestEventConstants:
         assert DOWNLOAD_COMPLETE == "download_complete"
         assert DOWNLOAD_ERROR == "download_error"
 
+    def test_event_constants_are_interned(self) -> None:
+        """Event constants should be the interned copies of their names."""
+        assert DOWNLOAD_PROGRESS is sys.intern("download_progress")
+        assert DOWNLOAD_COMPLETE is sys.intern("download_complete")
+        assert DOWNLOAD_ERROR is sys.intern("download_error")
+
     def test_event_constants_are_strings(self) -> None:
         """Event constants should be strings."""
         assert isinstance(DOWNLOAD_PROGRESS, str)
@@ -266,24 +580,24 @@ class TestEventBusIntegration:
     def test_workflow_subscribe_emit_unsubscribe(self) -> None:
         """Should handle complete subscription workflow."""
         bus = EventBus()
-        callback = Mock()
+        callback = _Spy()
 
         # Subscribe
         bus.subscribe(DOWNLOAD_PROGRESS, callback)
         bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
-        assert callback.call_count == 1
+        assert len(callback.calls) == 1
 
         # Unsubscribe
         bus.unsubscribe(DOWNLOAD_PROGRESS, callback)
         bus.emit(DOWNLOAD_PROGRESS, {"progress": 75})
-        assert callback.call_count == 1  # No additional call
+        assert len(callback.calls) == 1  # No additional call
 
     def test_multiple_events_workflow(self) -> None:
         """Should handle events in workflow sequence."""
         bus = EventBus()
-        progress_callback = Mock()
-        complete_callback = Mock()
-        error_callback = Mock()
+        progress_callback = _Spy()
+        complete_callback = _Spy()
+        error_callback = _Spy()
 
         bus.subscribe(DOWNLOAD_PROGRESS, progress_callback)
         bus.subscribe(DOWNLOAD_COMPLETE, complete_callback)
@@ -294,11 +608,11 @@ class TestEventBusIntegration:
         bus.emit(DOWNLOAD_PROGRESS, {"progress": 50})
         bus.emit(DOWNLOAD_COMPLETE, None)
 
-        assert progress_callback.call_count == 2
-        complete_callback.assert_called_once()
-        error_callback.assert_not_called()
+        assert len(progress_callback.calls) == 2
+        assert len(complete_callback.calls) == 1
+        assert error_callback.calls == []
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_progress_tracking_with_async(self) -> None:
         """Should track progress with async callbacks."""
         bus = EventBus()
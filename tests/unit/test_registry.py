@@ -16,9 +16,11 @@ class TestExtractorRegistry:
     @pytest.fixture(autouse=True)
     def reset_registry(self) -> Generator[None, None, None]:
         """Reset the registry singleton before each test."""
-        ExtractorRegistry._extractors.clear()
-        yield
-        ExtractorRegistry._extractors.clear()
+        ExtractorRegistry._reset()
+        try:
+            yield
+        finally:
+            ExtractorRegistry._reset()
 
     def test_register_decorator_stores_extractor(self) -> None:
         """Should register an extractor via decorator."""
@@ -57,6 +59,9 @@ class TestExtractorRegistry:
 
         assert "duplicate_name" in str(exc_info.value)
         assert "already registered" in str(exc_info.value).lower()
+        # The rejected class must not be reachable through URL lookups either
+        assert "second.com" not in ExtractorRegistry._domain_index
+        assert ExtractorRegistry.get_for_url("https://second.com/file") is None
 
     def test_get_returns_registered_extractor(self) -> None:
         """Should return an extractor by name."""
@@ -174,6 +179,26 @@ class TestExtractorRegistry:
         result = ExtractorRegistry.get_for_url(invalid_url)
         assert result is None
 
+    def test_get_for_url_with_str_url_pattern(self) -> None:
+        """Should compile a str URL_PATTERN on first use and keep the result."""
+        import re
+
+        @ExtractorRegistry.register
+        class PatternExtractor(BaseExtractor):
+            SUPPORTED_DOMAINS = ("pattern.com",)
+            EXTRACTOR_NAME = "pattern"
+            URL_PATTERN = r"https://pattern\.com/file/(?P<id>[a-z0-9]+)$"
+
+            async def extract(self, url: str, password: str | None = None):
+                pass
+
+        assert isinstance(PatternExtractor.URL_PATTERN, str)
+
+        assert ExtractorRegistry.get_for_url("https://pattern.com/file/abc123") is PatternExtractor
+        assert ExtractorRegistry.get_for_url("https://pattern.com/invalid/path") is None
+        assert isinstance(PatternExtractor.URL_PATTERN, re.Pattern)
+        assert PatternExtractor.extract_id("https://pattern.com/file/abc123") == "abc123"
+
     def test_get_for_url_with_multiple_extractors_returns_first_match(self) -> None:
         """Should return first matching extractor when multiple can handle URL."""
 
@@ -244,3 +269,88 @@ class TestExtractorRegistry:
         url = "https:///file/abc123"
         result = ExtractorRegistry.get_for_url(url)
         assert result is None
+
+    def test_get_for_url_rejects_invalid_url_before_asking_extractors(self) -> None:
+        """Should not consult extractors for non-http(s) or host-less URLs."""
+        calls: list[str] = []
+
+        @ExtractorRegistry.register
+        class GreedyExtractor(BaseExtractor):
+            SUPPORTED_DOMAINS = ("example.com",)
+            EXTRACTOR_NAME = "greedy"
+
+            @classmethod
+            def can_handle(cls, url: str) -> bool:
+                calls.append(url)
+                return True
+
+            async def extract(self, url: str, password: str | None = None):
+                pass
+
+        assert ExtractorRegistry.get_for_url("ftp://example.com/file") is None
+        assert ExtractorRegistry.get_for_url("https:///file/abc123") is None
+        assert calls == []
+        assert ExtractorRegistry.get_for_url("https://example.com/file") is GreedyExtractor
+
+    def test_get_for_url_matches_subdomains(self) -> None:
+        """Should find the extractor registered for a parent domain."""
+
+        @ExtractorRegistry.register
+        class ExampleExtractor(BaseExtractor):
+            SUPPORTED_DOMAINS = ("example.com",)
+            EXTRACTOR_NAME = "example"
+
+            async def extract(self, url: str, password: str | None = None):
+                pass
+
+        assert ExtractorRegistry.get_for_url("https://cdn.EXAMPLE.com:8443/f") is ExampleExtractor
+        assert ExtractorRegistry.get_for_url("https://notexample.com/f") is None
+
+    def test_get_for_url_consults_extractors_without_domains(self) -> None:
+        """Should still ask extractors that declare no SUPPORTED_DOMAINS."""
+
+        @ExtractorRegistry.register
+        class AnyHostExtractor(BaseExtractor):
+            EXTRACTOR_NAME = "any_host"
+
+            @classmethod
+            def can_handle(cls, url: str) -> bool:
+                return url.endswith(".bin")
+
+            async def extract(self, url: str, password: str | None = None):
+                pass
+
+        assert ExtractorRegistry.get_for_url("https://files.test/a.bin") is AnyHostExtractor
+        assert ExtractorRegistry.get_for_url("https://files.test/a.txt") is None
+
+    def test_get_for_url_caches_until_next_registration(self) -> None:
+        """Should reuse lookups and drop them when an extractor is registered."""
+        calls: list[str] = []
+
+        @ExtractorRegistry.register
+        class CountingExtractor(BaseExtractor):
+            SUPPORTED_DOMAINS = ("example.com",)
+            EXTRACTOR_NAME = "counting"
+
+            @classmethod
+            def can_handle(cls, url: str) -> bool:
+                calls.append(url)
+                return url.endswith("/known")
+
+            async def extract(self, url: str, password: str | None = None):
+                pass
+
+        url = "https://example.com/other"
+        assert ExtractorRegistry.get_for_url(url) is None
+        assert ExtractorRegistry.get_for_url(url) is None
+        assert calls == [url]
+
+        @ExtractorRegistry.register
+        class OtherExtractor(BaseExtractor):
+            SUPPORTED_DOMAINS = ("example.com",)
+            EXTRACTOR_NAME = "other"
+
+            async def extract(self, url: str, password: str | None = None):
+                pass
+
+        assert ExtractorRegistry.get_for_url(url) is OtherExtractor
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import tempfile
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import DEFAULT, AsyncMock, patch
 
 import pytest
+import pytest_asyncio
 
 from getit.config import Settings
 from getit.core.downloader import DownloadStatus, DownloadTask
@@ -18,13 +19,13 @@ from getit.service import DownloadService
 from getit.tasks import TaskRegistry, TaskStatus
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temp_dir():
     with tempfile.TemporaryDirectory() as tmpdir:
         yield Path(tmpdir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def registry():
     return ExtractorRegistry()
 
@@ -34,21 +35,61 @@ def event_bus():
     return EventBus()
 
 
-@pytest.fixture
-async def task_registry(temp_dir):
-    db_path = temp_dir / "test_tasks.db"
-    reg = TaskRegistry(db_path=db_path)
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _shared_task_registry():
+    reg = TaskRegistry(db_path=TaskRegistry.IN_MEMORY)
     await reg.connect()
     yield reg
     await reg.close()
 
 
-@pytest.fixture
-def settings(temp_dir):
-    return Settings(download_dir=temp_dir)
+@pytest_asyncio.fixture(loop_scope="module")
+async def task_registry(_shared_task_registry):
+    # Share one connection across the module; only the rows are per test
+    yield _shared_task_registry
+    await _shared_task_registry._db.execute("DELETE FROM tasks")
+    await _shared_task_registry._db.commit()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def settings(tmp_path_factory):
+    return Settings(download_dir=tmp_path_factory.mktemp("downloads"))
+
+
+# Download objects below are only read by DownloadService, so one instance
+# of each serves the whole module
+
+
+@pytest.fixture(scope="module")
+def sample_file_info():
+    return FileInfo(url="https://example.com/file", filename="test.txt", size=100)
+
+
+@pytest.fixture(scope="module")
+def downloading_task(sample_file_info, temp_dir):
+    task = DownloadTask(file_info=sample_file_info, output_path=temp_dir / "test.txt")
+    task.progress.status = DownloadStatus.DOWNLOADING
+    task.progress.downloaded = 50
+    task.progress.total = 100
+    return task
+
+
+@pytest.fixture(scope="module")
+def succeeded_result(sample_file_info, temp_dir):
+    task = DownloadTask(file_info=sample_file_info, output_path=temp_dir / "test.txt")
+    task.progress.status = DownloadStatus.COMPLETED
+    return DownloadResult.succeeded(task)
+
+
+@pytest.fixture(scope="module")
+def failed_result(sample_file_info, temp_dir):
+    task = DownloadTask(file_info=sample_file_info, output_path=temp_dir / "test.txt")
+    task.progress.status = DownloadStatus.FAILED
+    task.progress.error = "Download failed"
+    return DownloadResult.failed(task, "Download failed")
+
+
+@pytest_asyncio.fixture(loop_scope="module")
 async def service(registry, event_bus, task_registry, settings):
     svc = DownloadService(
         registry=registry, event_bus=event_bus, task_registry=task_registry, settings=settings
@@ -58,6 +99,14 @@ async def service(registry, event_bus, task_registry, settings):
     await svc.close()
 
 
+@pytest.fixture
+def mock_download(service, monkeypatch):
+    """Replace the service's DownloadManager.download_url with an AsyncMock."""
+    mock = AsyncMock()
+    monkeypatch.setattr(service._manager, "download_url", mock)
+    return mock
+
+
 class TestDownloadServiceInit:
     """Tests for DownloadService initialization."""
 
@@ -82,71 +131,61 @@ class TestDownloadServiceInit:
 class TestDownloadServiceDownload:
     """Tests for DownloadService.download()."""
 
-    @pytest.mark.asyncio
-    async def test_download_creates_task(self, service, event_bus, task_registry, temp_dir):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_download_creates_task(
+        self, service, mock_download, task_registry, temp_dir, succeeded_result
+    ):
         """Should create task before extraction."""
         url = "https://example.com/file"
         output_dir = temp_dir / "downloads"
 
-        with patch.object(
-            service._manager, "download_url", new_callable=AsyncMock
-        ) as mock_download:
-            mock_download.return_value = [
-                DownloadResult.succeeded(
-                    DownloadTask(
-                        file_info=FileInfo(url=url, filename="test.txt"),
-                        output_path=output_dir / "test.txt",
-                    )
-                )
-            ]
-
-            task_id = await service.download(url, output_dir)
-
-            assert task_id is not None
-            task = await task_registry.get_task(task_id)
-            assert task is not None
-            assert task.url == url
-
-    @pytest.mark.asyncio
-    async def test_download_updates_status_extracting(self, service, task_registry, temp_dir):
+        mock_download.return_value = [succeeded_result]
+
+        task_id = await service.download(url, output_dir)
+
+        assert task_id is not None
+        task = await task_registry.get_task(task_id)
+        assert task is not None
+        assert task.url == url
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_download_updates_status_extracting(
+        self, service, mock_download, task_registry, temp_dir
+    ):
         """Should update task status to EXTRACTING during extraction."""
         url = "https://example.com/file"
         output_dir = temp_dir / "downloads"
 
-        with patch.object(
-            service._manager, "download_url", new_callable=AsyncMock
-        ) as mock_download:
-            mock_download.return_value = []
+        mock_download.return_value = []
 
-            task_id = await service.download(url, output_dir)
-            task = await task_registry.get_task(task_id)
+        task_id = await service.download(url, output_dir)
+        task = await task_registry.get_task(task_id)
 
-            # After extraction, should be at least past EXTRACTING
-            assert task.status != TaskStatus.PENDING
+        # After extraction, should be at least past EXTRACTING
+        assert task.status != TaskStatus.PENDING
 
-    @pytest.mark.asyncio
-    async def test_download_with_password(self, service):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_download_with_password(self, service, mock_download, temp_dir):
         """Should pass password to extract_files."""
         url = "https://example.com/file"
-        output_dir = Path("/tmp/downloads")
+        output_dir = temp_dir / "downloads"
         password = "secret"
 
-        with patch.object(
-            service._manager, "download_url", new_callable=AsyncMock
-        ) as mock_download:
-            mock_download.return_value = []
-
-            await service.download(url, output_dir, password=password)
-            mock_download.assert_called_once()
-            args, _ = mock_download.call_args
-            assert args[0] == url
-            assert args[1] == password
-
-    @pytest.mark.asyncio
-    async def test_download_emits_progress_events(self, service, event_bus):
+        mock_download.return_value = []
+
+        await service.download(url, output_dir, password=password)
+        mock_download.assert_called_once()
+        args, _ = mock_download.call_args
+        assert args[0] == url
+        assert args[1] == password
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_download_emits_progress_events(
+        self, service, mock_download, event_bus, downloading_task, temp_dir
+    ):
         """Should emit DOWNLOAD_PROGRESS events via progress callback."""
         url = "https://example.com/file"
-        output_dir = Path("/tmp/downloads")
+        output_dir = temp_dir / "downloads"
         progress_events = []
 
         def capture_progress(data):
@@ -154,33 +193,26 @@ class TestDownloadServiceDownload:
 
         event_bus.subscribe(DOWNLOAD_PROGRESS, capture_progress)
 
-        with patch.object(
-            service._manager, "download_url", new_callable=AsyncMock
-        ) as mock_download:
-            # Simulate progress callback being called
-            def side_effect(url, password, output_dir, on_progress):
-                if on_progress:
-                    task = DownloadTask(
-                        file_info=FileInfo(url=url, filename="test.txt"),
-                        output_path=Path("/tmp/test.txt"),
-                    )
-                    task.progress.status = DownloadStatus.DOWNLOADING
-                    task.progress.downloaded = 50
-                    task.progress.total = 100
-                    on_progress(task)
-                return [DownloadResult.succeeded(task)]
-
-            mock_download.side_effect = side_effect
-
-            await service.download(url, output_dir)
-
-            assert len(progress_events) > 0
-
-    @pytest.mark.asyncio
-    async def test_download_emits_complete_event(self, service, event_bus):
+        # Report progress mid-download, as DownloadManager does, then fall
+        # through to return_value
+        def report_progress(url, password, output_dir, on_progress):
+            on_progress(downloading_task)
+            return DEFAULT
+
+        mock_download.side_effect = report_progress
+        mock_download.return_value = [DownloadResult.succeeded(downloading_task)]
+
+        await service.download(url, output_dir)
+
+        assert len(progress_events) > 0
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_download_emits_complete_event(
+        self, service, mock_download, event_bus, temp_dir, succeeded_result
+    ):
         """Should emit DOWNLOAD_COMPLETE on success."""
         url = "https://example.com/file"
-        output_dir = Path("/tmp/downloads")
+        output_dir = temp_dir / "downloads"
         complete_events = []
 
         def capture_complete(data):
@@ -188,24 +220,19 @@ class TestDownloadServiceDownload:
 
         event_bus.subscribe(DOWNLOAD_COMPLETE, capture_complete)
 
-        with patch.object(
-            service._manager, "download_url", new_callable=AsyncMock
-        ) as mock_download:
-            file_info = FileInfo(url=url, filename="test.txt", size=100)
-
-            task = DownloadTask(file_info=file_info, output_path=output_dir / "test.txt")
-            task.progress.status = DownloadStatus.COMPLETED
-            mock_download.return_value = [DownloadResult.succeeded(task)]
+        mock_download.return_value = [succeeded_result]
 
-            await service.download(url, output_dir)
+        await service.download(url, output_dir)
 
-            assert len(complete_events) > 0
+        assert len(complete_events) > 0
 
-    @pytest.mark.asyncio
-    async def test_download_emits_error_event(self, service, event_bus):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_download_emits_error_event(
+        self, service, mock_download, event_bus, temp_dir, failed_result
+    ):
         """Should emit DOWNLOAD_ERROR on failure."""
         url = "https://example.com/file"
-        output_dir = Path("/tmp/downloads")
+        output_dir = temp_dir / "downloads"
         error_events = []
 
         def capture_error(data):
@@ -213,25 +240,17 @@ class TestDownloadServiceDownload:
 
         event_bus.subscribe(DOWNLOAD_ERROR, capture_error)
 
-        with patch.object(
-            service._manager, "download_url", new_callable=AsyncMock
-        ) as mock_download:
-            file_info = FileInfo(url=url, filename="test.txt", size=100)
-
-            task = DownloadTask(file_info=file_info, output_path=output_dir / "test.txt")
-            task.progress.status = DownloadStatus.FAILED
-            task.progress.error = "Download failed"
-            mock_download.return_value = [DownloadResult.failed(task, "Download failed")]
+        mock_download.return_value = [failed_result]
 
-            await service.download(url, output_dir)
+        await service.download(url, output_dir)
 
-            assert len(error_events) > 0
+        assert len(error_events) > 0
 
 
 class TestDownloadServiceListFiles:
     """Tests for DownloadService.list_files()."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_list_files_returns_file_info(self, service):
         """Should return list of FileInfo from extractor."""
         url = "https://example.com/file"
@@ -251,7 +270,7 @@ class TestDownloadServiceListFiles:
             assert files[0].filename == "test1.txt"
             assert files[1].filename == "test2.txt"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_list_files_with_password(self, service):
         """Should pass password to extract_files."""
         url = "https://example.com/file"
@@ -269,7 +288,7 @@ class TestDownloadServiceListFiles:
 class TestDownloadServiceGetStatus:
     """Tests for DownloadService.get_status()."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_status_returns_task_info(self, service, task_registry):
         """Should return TaskInfo for existing task."""
         task_id = await task_registry.create_task("https://example.com", Path("/tmp"))
@@ -279,7 +298,7 @@ class TestDownloadServiceGetStatus:
         assert status is not None
         assert status.task_id == task_id
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_status_returns_none_for_missing_task(self, service):
         """Should return None for non-existent task."""
         status = await service.get_status("nonexistent-uuid")
@@ -289,7 +308,7 @@ class TestDownloadServiceGetStatus:
 class TestDownloadServiceListActive:
     """Tests for DownloadService.list_active()."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_list_active_returns_pending_tasks(self, service, task_registry):
         """Should return tasks that are not completed/failed/cancelled."""
         task1_id = await task_registry.create_task("https://example.com/1", Path("/tmp"))
@@ -306,7 +325,7 @@ class TestDownloadServiceListActive:
 class TestDownloadServiceCancel:
     """Tests for DownloadService.cancel()."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_cancel_updates_task_status(self, service, task_registry):
         """Should update task status to CANCELLED."""
         task_id = await task_registry.create_task("https://example.com", Path("/tmp"))
@@ -317,7 +336,7 @@ class TestDownloadServiceCancel:
         task = await task_registry.get_task(task_id)
         assert task.status == TaskStatus.CANCELLED
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_cancel_returns_false_for_missing_task(self, service):
         """Should return False for non-existent task."""
         result = await service.cancel("nonexistent-uuid")
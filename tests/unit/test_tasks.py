@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import tempfile
+import uuid
 from collections.abc import AsyncGenerator, Generator
-from datetime import datetime
+from datetime import datetime, timedelta, tzinfo
+from itertools import count
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
 from getit.tasks import TaskInfo, TaskRegistry, TaskStatus
 
+_URL = "https://example.com"
+_OUTPUT_DIR = Path("/tmp")
+
 
 class TestTaskStatus:
     """Tests for TaskStatus enum."""
@@ -62,8 +69,8 @@ class TestTaskInfo:
         """Should store error message."""
         task = TaskInfo(
             task_id="test",
-            url="https://example.com",
-            output_dir=Path("/tmp"),
+            url=_URL,
+            output_dir=_OUTPUT_DIR,
             status=TaskStatus.FAILED,
             progress={"percentage": 50.0},
             error="Download failed",
@@ -76,8 +83,8 @@ class TestTaskInfo:
         """Should store progress value."""
         task = TaskInfo(
             task_id="test",
-            url="https://example.com",
-            output_dir=Path("/tmp"),
+            url=_URL,
+            output_dir=_OUTPUT_DIR,
             status=TaskStatus.DOWNLOADING,
             progress={"percentage": 75.5},
             error=None,
@@ -87,23 +94,73 @@ class TestTaskInfo:
         assert task.progress == {"percentage": 75.5}
 
 
-@pytest.mark.asyncio
+class _TickingDatetime(datetime):
+    """datetime whose now() moves forward one second on every call."""
+
+    _ticks = count()
+
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> _TickingDatetime:
+        return cls(2026, 1, 1, tzinfo=tz) + timedelta(seconds=next(cls._ticks))
+
+
+_FROZEN_NOW = datetime(2024, 1, 1)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns _FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> _FrozenDatetime:
+        return cls.combine(_FROZEN_NOW.date(), _FROZEN_NOW.time(), tzinfo=tz)
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pin every TaskRegistry timestamp to _FROZEN_NOW."""
+    monkeypatch.setattr("getit.tasks.datetime", _FrozenDatetime)
+
+
+@pytest.fixture
+def ticking_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every TaskRegistry timestamp a distinct value without sleeping."""
+    monkeypatch.setattr("getit.tasks.datetime", _TickingDatetime)
+
+
+@pytest.fixture(scope="module")
+def _db_dir() -> Generator[Path, None, None]:
+    """Provide one temporary directory for the on-disk database tests."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def _shared_registry() -> AsyncGenerator[TaskRegistry, None]:
+    """Provide one connected in-memory TaskRegistry for the whole module."""
+    reg = TaskRegistry(TaskRegistry.IN_MEMORY)
+    await reg.connect()
+    yield reg
+    await reg.close()
+
+
+# Runs on the module's event loop so every test can reuse the shared
+# registry's connection instead of reconnecting and re-creating the schema
+@pytest.mark.asyncio(loop_scope="module")
 class TestTaskRegistry:
     """Tests for TaskRegistry class."""
 
     @pytest.fixture
-    def temp_db_path(self) -> Generator[Path, None, None]:
-        """Provide a temporary database path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir) / "tasks.db"
-
-    @pytest.fixture
-    async def registry(self, temp_db_path: Path) -> AsyncGenerator[TaskRegistry, None]:
-        """Provide a connected TaskRegistry instance."""
-        reg = TaskRegistry(temp_db_path)
-        await reg.connect()
-        yield reg
-        await reg.close()
+    def temp_db_path(self, _db_dir: Path) -> Path:
+        """Provide a database path that does not exist yet."""
+        return _db_dir / f"{uuid.uuid4().hex}.db"
+
+    @pytest_asyncio.fixture(loop_scope="module")
+    async def registry(self, _shared_registry: TaskRegistry) -> AsyncGenerator[TaskRegistry, None]:
+        """Provide the shared TaskRegistry, emptied again after each test."""
+        yield _shared_registry
+        assert _shared_registry._db is not None
+        await _shared_registry._db.execute("DELETE FROM tasks")
+        await _shared_registry._db.commit()
 
     async def test_connect_creates_database(self, temp_db_path: Path) -> None:
         """Should create database file on connect."""
@@ -113,6 +170,16 @@ class TestTaskRegistry:
         assert temp_db_path.exists()
         await reg.close()
 
+    async def test_connect_in_memory_writes_no_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should keep an IN_MEMORY database off the filesystem."""
+        monkeypatch.chdir(tmp_path)
+        async with TaskRegistry(TaskRegistry.IN_MEMORY) as reg:
+            task_id = await reg.create_task("https://example.com/file", _OUTPUT_DIR)
+            assert await reg.get_task(task_id) is not None
+        assert list(tmp_path.iterdir()) == []
+
     async def test_connect_sets_permissions(self, temp_db_path: Path) -> None:
         """Should set restrictive permissions on database file."""
         import sys
@@ -153,20 +220,32 @@ class TestTaskRegistry:
         assert task.progress == {}
         assert task.error is None
 
+    @pytest.mark.usefixtures("frozen_clock")
     async def test_create_task_sets_timestamps(self, registry: TaskRegistry) -> None:
         """Should set created_at and updated_at on creation."""
-        before = datetime.now()
         task_id = await registry.create_task(
-            url="https://example.com",
-            output_dir=Path("/tmp"),
+            url=_URL,
+            output_dir=_OUTPUT_DIR,
         )
-        after = datetime.now()
 
         task = await registry.get_task(task_id)
         assert task is not None
-        assert before <= task.created_at <= after
-        assert before <= task.updated_at <= after
-        assert task.created_at == task.updated_at
+        assert task.created_at == _FROZEN_NOW
+        assert task.updated_at == _FROZEN_NOW
+
+    async def test_create_tasks_inserts_all(self, registry: TaskRegistry) -> None:
+        """Should create one PENDING task per entry, returning IDs in order."""
+        task_ids = await registry.create_tasks(
+            [("https://example.com/1", Path("/tmp/a")), ("https://example.com/2", Path("/tmp/b"))]
+        )
+
+        assert len(set(task_ids)) == 2
+        tasks = await asyncio.gather(*(registry.get_task(task_id) for task_id in task_ids))
+        assert [(t.url, t.output_dir) for t in tasks if t] == [
+            ("https://example.com/1", Path("/tmp/a")),
+            ("https://example.com/2", Path("/tmp/b")),
+        ]
+        assert all(t and t.status == TaskStatus.PENDING for t in tasks)
 
     async def test_get_task_returns_none_for_nonexistent(self, registry: TaskRegistry) -> None:
         """Should return None for nonexistent task_id."""
@@ -176,8 +255,8 @@ class TestTaskRegistry:
     async def test_update_task_changes_status(self, registry: TaskRegistry) -> None:
         """Should update task status."""
         task_id = await registry.create_task(
-            url="https://example.com",
-            output_dir=Path("/tmp"),
+            url=_URL,
+            output_dir=_OUTPUT_DIR,
         )
 
         await registry.update_task(task_id, status=TaskStatus.DOWNLOADING)
@@ -189,8 +268,8 @@ class TestTaskRegistry:
     async def test_update_task_changes_progress(self, registry: TaskRegistry) -> None:
         """Should update task progress."""
         task_id = await registry.create_task(
-            url="https://example.com",
-            output_dir=Path("/tmp"),
+            url=_URL,
+            output_dir=_OUTPUT_DIR,
         )
 
         await registry.update_task(task_id, progress={"percentage": 45.5})
@@ -202,8 +281,8 @@ class TestTaskRegistry:
     async def test_update_task_sets_error(self, registry: TaskRegistry) -> None:
         """Should update task error message."""
         task_id = await registry.create_task(
-            url="https://example.com",
-            output_dir=Path("/tmp"),
+            url=_URL,
+            output_dir=_OUTPUT_DIR,
         )
 
         error_msg = "Network timeout"
@@ -214,85 +293,49 @@ class TestTaskRegistry:
         assert task.status == TaskStatus.FAILED
         assert task.error == error_msg
 
+    @pytest.mark.usefixtures("ticking_clock")
     async def test_update_task_updates_timestamp(self, registry: TaskRegistry) -> None:
         """Should update updated_at timestamp."""
         task_id = await registry.create_task(
-            url="https://example.com",
-            output_dir=Path("/tmp"),
+            url=_URL,
+            output_dir=_OUTPUT_DIR,
         )
         original_task = await registry.get_task(task_id)
         assert original_task is not None
 
-        # Small delay to ensure timestamp difference
-        import asyncio
-
-        await asyncio.sleep(0.01)
-
         await registry.update_task(task_id, progress={"percentage": 50.0})
         updated_task = await registry.get_task(task_id)
 
         assert updated_task is not None
         assert updated_task.updated_at > original_task.updated_at
 
-    async def test_list_active_excludes_completed(self, registry: TaskRegistry) -> None:
-        """Should exclude COMPLETED tasks from active list."""
-        task1_id = await registry.create_task(url="https://example.com/1", output_dir=Path("/tmp"))
-        task2_id = await registry.create_task(url="https://example.com/2", output_dir=Path("/tmp"))
-
-        await registry.update_task(task1_id, status=TaskStatus.COMPLETED)
-
-        active = await registry.list_active()
-        assert len(active) == 1
-        assert active[0].task_id == task2_id
-
-    async def test_list_active_excludes_failed(self, registry: TaskRegistry) -> None:
-        """Should exclude FAILED tasks from active list."""
-        task1_id = await registry.create_task(url="https://example.com/1", output_dir=Path("/tmp"))
-        task2_id = await registry.create_task(url="https://example.com/2", output_dir=Path("/tmp"))
-
-        await registry.update_task(task1_id, status=TaskStatus.FAILED)
-
-        active = await registry.list_active()
-        assert len(active) == 1
-        assert active[0].task_id == task2_id
-
-    async def test_list_active_excludes_cancelled(self, registry: TaskRegistry) -> None:
-        """Should exclude CANCELLED tasks from active list."""
-        task1_id = await registry.create_task(url="https://example.com/1", output_dir=Path("/tmp"))
-        task2_id = await registry.create_task(url="https://example.com/2", output_dir=Path("/tmp"))
-
-        await registry.update_task(task1_id, status=TaskStatus.CANCELLED)
-
-        active = await registry.list_active()
-        assert len(active) == 1
-        assert active[0].task_id == task2_id
-
-    async def test_list_active_includes_pending(self, registry: TaskRegistry) -> None:
-        """Should include PENDING tasks in active list."""
-        task_id = await registry.create_task(url="https://example.com", output_dir=Path("/tmp"))
-
-        active = await registry.list_active()
-        assert len(active) == 1
-        assert active[0].task_id == task_id
-        assert active[0].status == TaskStatus.PENDING
-
-    async def test_list_active_includes_extracting(self, registry: TaskRegistry) -> None:
-        """Should include EXTRACTING tasks in active list."""
-        task_id = await registry.create_task(url="https://example.com", output_dir=Path("/tmp"))
-        await registry.update_task(task_id, status=TaskStatus.EXTRACTING)
-
-        active = await registry.list_active()
-        assert len(active) == 1
-        assert active[0].status == TaskStatus.EXTRACTING
+    @pytest.mark.parametrize(
+        ("status", "active"),
+        [
+            (TaskStatus.PENDING, True),
+            (TaskStatus.EXTRACTING, True),
+            (TaskStatus.DOWNLOADING, True),
+            (TaskStatus.COMPLETED, False),
+            (TaskStatus.FAILED, False),
+            (TaskStatus.CANCELLED, False),
+        ],
+        ids=lambda value: value.name if isinstance(value, TaskStatus) else None,
+    )
+    async def test_list_active_filters_by_status(
+        self, registry: TaskRegistry, status: TaskStatus, active: bool
+    ) -> None:
+        """Should list only tasks that are not finished, failed or cancelled."""
+        task_id, other_id = await registry.create_tasks(
+            [("https://example.com/1", _OUTPUT_DIR), ("https://example.com/2", _OUTPUT_DIR)]
+        )
+        await registry.update_task(task_id, status=status)
 
-    async def test_list_active_includes_downloading(self, registry: TaskRegistry) -> None:
-        """Should include DOWNLOADING tasks in active list."""
-        task_id = await registry.create_task(url="https://example.com", output_dir=Path("/tmp"))
-        await registry.update_task(task_id, status=TaskStatus.DOWNLOADING)
+        listed = {(t.task_id, t.status) for t in await registry.list_active()}
 
-        active = await registry.list_active()
-        assert len(active) == 1
-        assert active[0].status == TaskStatus.DOWNLOADING
+        expected = {(other_id, TaskStatus.PENDING)}
+        if active:
+            expected.add((task_id, status))
+        assert listed == expected
 
     async def test_list_active_returns_empty_when_no_tasks(self, registry: TaskRegistry) -> None:
         """Should return empty list when no tasks exist."""
@@ -301,7 +344,7 @@ class TestTaskRegistry:
 
     async def test_delete_task_removes_from_database(self, registry: TaskRegistry) -> None:
         """Should remove task from database."""
-        task_id = await registry.create_task(url="https://example.com", output_dir=Path("/tmp"))
+        task_id = await registry.create_task(url=_URL, output_dir=_OUTPUT_DIR)
 
         await registry.delete_task(task_id)
         task = await registry.get_task(task_id)
@@ -314,13 +357,15 @@ class TestTaskRegistry:
 
     async def test_delete_task_multiple_preserves_others(self, registry: TaskRegistry) -> None:
         """Should only delete specified task, not others."""
-        task1_id = await registry.create_task(url="https://example.com/1", output_dir=Path("/tmp"))
-        task2_id = await registry.create_task(url="https://example.com/2", output_dir=Path("/tmp"))
+        task1_id, task2_id = await registry.create_tasks(
+            [("https://example.com/1", _OUTPUT_DIR), ("https://example.com/2", _OUTPUT_DIR)]
+        )
 
         await registry.delete_task(task1_id)
 
-        task1 = await registry.get_task(task1_id)
-        task2 = await registry.get_task(task2_id)
+        task1, task2 = await asyncio.gather(
+            registry.get_task(task1_id), registry.get_task(task2_id)
+        )
 
         assert task1 is None
         assert task2 is not None
@@ -328,7 +373,7 @@ class TestTaskRegistry:
     async def test_context_manager_async_with(self, temp_db_path: Path) -> None:
         """Should work as async context manager."""
         async with TaskRegistry(temp_db_path) as reg:
-            task_id = await reg.create_task(url="https://example.com", output_dir=Path("/tmp"))
+            task_id = await reg.create_task(url=_URL, output_dir=_OUTPUT_DIR)
             task = await reg.get_task(task_id)
             assert task is not None
 
@@ -336,17 +381,17 @@ class TestTaskRegistry:
         """Should persist data across connection cycles."""
         # Create task in first connection
         async with TaskRegistry(temp_db_path) as reg1:
-            task_id = await reg1.create_task(url="https://example.com", output_dir=Path("/tmp"))
+            task_id = await reg1.create_task(url=_URL, output_dir=_OUTPUT_DIR)
 
         # Verify task exists in second connection
         async with TaskRegistry(temp_db_path) as reg2:
             task = await reg2.get_task(task_id)
             assert task is not None
-            assert task.url == "https://example.com"
+            assert task.url == _URL
 
     async def test_progress_persists_as_float(self, registry: TaskRegistry) -> None:
         """Should store and retrieve progress as dict."""
-        task_id = await registry.create_task(url="https://example.com", output_dir=Path("/tmp"))
+        task_id = await registry.create_task(url=_URL, output_dir=_OUTPUT_DIR)
 
         await registry.update_task(task_id, progress={"percentage": 33.333})
         task = await registry.get_task(task_id)
@@ -357,22 +402,19 @@ class TestTaskRegistry:
     async def test_output_dir_persists_as_path(self, registry: TaskRegistry) -> None:
         """Should store and retrieve output_dir as Path."""
         output_dir = Path("/tmp/downloads/subdir")
-        task_id = await registry.create_task(url="https://example.com", output_dir=output_dir)
+        task_id = await registry.create_task(url=_URL, output_dir=output_dir)
 
         task = await registry.get_task(task_id)
         assert task is not None
         assert task.output_dir == output_dir
         assert isinstance(task.output_dir, Path)
 
+    @pytest.mark.usefixtures("ticking_clock")
     async def test_list_active_ordered_by_created_at(self, registry: TaskRegistry) -> None:
         """Should return active tasks ordered by creation time."""
-        import asyncio
-
-        task1_id = await registry.create_task(url="https://example.com/1", output_dir=Path("/tmp"))
-        await asyncio.sleep(0.01)
-        task2_id = await registry.create_task(url="https://example.com/2", output_dir=Path("/tmp"))
-        await asyncio.sleep(0.01)
-        task3_id = await registry.create_task(url="https://example.com/3", output_dir=Path("/tmp"))
+        task1_id = await registry.create_task(url="https://example.com/1", output_dir=_OUTPUT_DIR)
+        task2_id = await registry.create_task(url="https://example.com/2", output_dir=_OUTPUT_DIR)
+        task3_id = await registry.create_task(url="https://example.com/3", output_dir=_OUTPUT_DIR)
 
         active = await registry.list_active()
         assert len(active) == 3
@@ -383,7 +425,7 @@ class TestTaskRegistry:
 
     async def test_error_can_be_cleared(self, registry: TaskRegistry) -> None:
         """Should allow clearing error by setting to None."""
-        task_id = await registry.create_task(url="https://example.com", output_dir=Path("/tmp"))
+        task_id = await registry.create_task(url=_URL, output_dir=_OUTPUT_DIR)
 
         await registry.update_task(task_id, error="Some error")
         task = await registry.get_task(task_id)